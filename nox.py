@@ -202,6 +202,23 @@ def make_images(session):
         session.run("python", script, env=env)
 
 
+@nox.session
+def benchmarks(session):
+    session.interpreter = SINGLE_INTERP
+    # Install all dependencies.
+    session.install("--requirement", "make-images-requirements.txt")
+    # Run the script(s).
+    env = {"PYTHONPATH": get_path("src")}
+    script_paths = (
+        ("benchmarks", "float32_compensated.py"),
+        ("benchmarks", "estrin_vs_horner.py"),
+        ("benchmarks", "grid_vs_de_casteljau.py"),
+    )
+    for segments in script_paths:
+        script = get_path("scripts", *segments)
+        session.run("python", script, env=env)
+
+
 @nox.session
 def update_requirements(session):
     session.interpreter = SINGLE_INTERP
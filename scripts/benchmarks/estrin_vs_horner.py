@@ -0,0 +1,80 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare Estrin's scheme against Horner's method.
+
+Random polynomials of increasing degree are evaluated both at a single
+point (the scalar functions) and at a batch of points (the vectorized
+functions). The timings are the best of several runs.
+"""
+
+import timeit
+
+import numpy as np
+
+import estrin
+import horner
+
+
+DEGREES = (4, 16, 64, 256)
+NUM_POINTS = 2 ** 16
+NUM_SCALAR_CALLS = 200
+NUM_REPEAT = 5
+
+
+def best_time(fn, *args, number=1):
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=NUM_REPEAT, number=number)) / number
+
+
+def report(name, scalar_seconds, array_seconds):
+    print(
+        "{:<24} {:>14.2f} {:>12.2f}".format(
+            name, 1e6 * scalar_seconds, NUM_POINTS / array_seconds / 1e6
+        )
+    )
+
+
+def main():
+    rng = np.random.RandomState(1234)
+    x_vals = rng.uniform(-1.0, 1.0, NUM_POINTS)
+    x_val = float(x_vals[0])
+
+    functions = (
+        ("horner.basic", horner.basic, horner.basic_array),
+        (
+            "horner.compensated",
+            horner.compensated,
+            horner.compensated_array,
+        ),
+        ("estrin.basic", estrin.basic, estrin.basic_array),
+        (
+            "estrin.compensated",
+            estrin.compensated,
+            estrin.compensated_array,
+        ),
+    )
+    for degree in DEGREES:
+        coeffs = tuple(rng.standard_normal(degree + 1))
+        print("Degree {}".format(degree))
+        print("{:<24} {:>14} {:>12}".format("", "us/call", "Mpoints/s"))
+        for name, scalar_fn, array_fn in functions:
+            scalar_seconds = best_time(
+                scalar_fn, x_val, coeffs, number=NUM_SCALAR_CALLS
+            )
+            array_seconds = best_time(array_fn, x_vals, coeffs)
+            report(name, scalar_seconds, array_seconds)
+        print("")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Compare compensated ``float32`` evaluation against plain ``float64``.
+
+This uses :math:`p(s) = (s - 1) \left(s - \frac{3}{4}\right)^7` in
+Bernstein form (for de Casteljau) and :math:`p(x) = (2x - 1)^3` in
+monomial form (for Horner). The same ``float32`` points are used in both
+precisions, so the relative errors are directly comparable.
+
+This records a negative result: with NumPy, compensated evaluation in
+``float32`` (the Horner and de Casteljau updates in ``float32``, with the
+value and error only added in ``float64``) is more accurate than plain
+``float32``, but it is **both** slower and less accurate than plain
+``float64``. Each compensated step makes several passes over memory (one
+per temporary), so halving the size of each value does not make up for
+the extra work. A ``float32`` Dekker split (rather than computing the
+product errors via ``float64``) is slower still.
+"""
+
+import fractions
+import timeit
+
+import numpy as np
+
+import de_casteljau
+import horner
+
+
+F = fractions.Fraction
+POLY_COEFFS = (8.0, -12.0, 6.0, -1.0)
+POLY_ROOT = 0.5
+# p(s) = (s - 1) (s - 3/4)^7
+BEZIER_COEFFS = (
+    2187.0 / 16384.0,
+    -5103.0 / 131072.0,
+    729.0 / 65536.0,
+    -405.0 / 131072.0,
+    27.0 / 32768.0,
+    -27.0 / 131072.0,
+    3.0 / 65536.0,
+    -1.0 / 131072.0,
+    0.0,
+)
+BEZIER_ROOT = 0.75
+DELTA = 0.125
+NUM_POINTS = 2 ** 20
+NUM_ERROR_POINTS = 1000
+NUM_REPEAT = 5
+
+
+def exact_horner(x, coeffs):
+    p = F(0)
+    for coeff in coeffs:
+        p = p * x + F(coeff)
+    return p
+
+
+def exact_de_casteljau(s, coeffs):
+    r = 1 - s
+    pk = [F(coeff) for coeff in coeffs]
+    for k in range(len(coeffs) - 1):
+        pk = [r * pk[j] + s * pk[j + 1] for j in range(len(pk) - 1)]
+    return pk[0]
+
+
+def median_error(computed, points, exact_fn, coeffs):
+    errors = []
+    for value, point in zip(computed[:NUM_ERROR_POINTS], points):
+        exact = exact_fn(F(float(point)), coeffs)
+        if exact == 0:
+            continue
+        errors.append(float(abs((F(float(value)) - exact) / exact)))
+    return np.median(errors)
+
+
+def best_time(fn, *args):
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=NUM_REPEAT, number=1))
+
+
+def horner_compensated32(x, coeffs):
+    coeffs = tuple(np.float32(coeff) for coeff in coeffs)
+    p, e = horner._compensated_array(x, coeffs)
+    return p.astype(np.float64) + e
+
+
+def de_casteljau_compensated32(s, coeffs):
+    coeffs = tuple(np.float32(coeff) for coeff in coeffs)
+    b, db = de_casteljau._compensated_k_array(s, coeffs, 2)
+    return b.astype(np.float64) + db
+
+
+def report(name, fn, args, points, exact_fn, coeffs):
+    seconds = best_time(fn, *args)
+    computed = fn(*args)
+    error = median_error(computed, points, exact_fn, coeffs)
+    throughput = NUM_POINTS / seconds / 1e6
+    print("{:<34} {:>10.2f} {:>14.3e}".format(name, throughput, error))
+
+
+def main():
+    rng = np.random.RandomState(1234)
+    offsets = rng.uniform(-DELTA, DELTA, NUM_POINTS)
+
+    print("{:<34} {:>10} {:>14}".format("", "Mpoints/s", "median error"))
+
+    x32 = (POLY_ROOT + offsets).astype(np.float32)
+    x64 = x32.astype(np.float64)
+    args = (x32, exact_horner, POLY_COEFFS)
+    report(
+        "horner._basic_array (float64)",
+        horner._basic_array,
+        (x64, POLY_COEFFS),
+        *args
+    )
+    coeffs32 = tuple(np.float32(coeff) for coeff in POLY_COEFFS)
+    report(
+        "horner._basic_array (float32)",
+        horner._basic_array,
+        (x32, coeffs32),
+        *args
+    )
+    report(
+        "horner compensated (float32)",
+        horner_compensated32,
+        (x32, POLY_COEFFS),
+        *args
+    )
+
+    s32 = (BEZIER_ROOT + offsets).astype(np.float32)
+    s64 = s32.astype(np.float64)
+    args = (s32, exact_de_casteljau, BEZIER_COEFFS)
+    report(
+        "de_casteljau._basic_array (float64)",
+        de_casteljau._basic_array,
+        (s64, BEZIER_COEFFS),
+        *args
+    )
+    coeffs32 = tuple(np.float32(coeff) for coeff in BEZIER_COEFFS)
+    report(
+        "de_casteljau._basic_array (float32)",
+        de_casteljau._basic_array,
+        (s32, coeffs32),
+        *args
+    )
+    report(
+        "de_casteljau compensated (float32)",
+        de_casteljau_compensated32,
+        (s32, BEZIER_COEFFS),
+        *args
+    )
+
+
+if __name__ == "__main__":
+    main()
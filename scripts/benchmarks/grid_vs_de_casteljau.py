@@ -0,0 +1,94 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare forward differences against the de Casteljau algorithm.
+
+The polynomial from ``k-compensated/smooth_drawing.py`` is evaluated on
+401 point grids, with a compensated de Casteljau evaluation at every
+point (one point at a time and batched over all points) and with
+:func:`forward_differences.evaluate_grid`. The timings are the best of
+several runs and the error is the largest absolute error at the
+``numpy.linspace`` points.
+
+With NumPy, the batched compensated de Casteljau call is both faster and
+(away from roots of :math:`p'`) more accurate than
+:func:`forward_differences.evaluate_grid`; the forward differences only
+beat the one-point-at-a-time loop.
+"""
+
+import timeit
+
+import numpy as np
+
+import de_casteljau
+import factored
+import forward_differences
+
+
+ROOT = 0.75
+DELTA_S = 1e-5
+NUM_POINTS = 401
+NUM_REPEAT = 5
+# p(s) = (s - 1) (s - 3/4)^7
+POLY = factored.FactoredPolynomial((1.0, ROOT), (1, 7))
+GRIDS = ((ROOT - DELTA_S, ROOT + DELTA_S), (0.2, 0.9))
+
+
+def best_time(fn, *args):
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=NUM_REPEAT, number=1))
+
+
+def de_casteljau_loop(coeffs, start, stop, num):
+    s_vals = np.linspace(start, stop, num)
+    return np.array([de_casteljau.compensated(s, coeffs) for s in s_vals])
+
+
+def de_casteljau_batched(coeffs, start, stop, num):
+    s_vals = np.linspace(start, stop, num)
+    return de_casteljau.compensated(s_vals, coeffs)
+
+
+def max_error(values, start, stop, num):
+    s_vals = np.linspace(start, stop, num)
+    return max(
+        abs(float(POLY.exact(float(s)) - float(value)))
+        for s, value in zip(s_vals, values)
+    )
+
+
+def report(name, fn, args):
+    seconds = best_time(fn, *args)
+    error = max_error(fn(*args), *args[1:4])
+    print("{:<32} {:>10.2f} {:>12.3e}".format(name, 1e3 * seconds, error))
+
+
+def main():
+    coeffs = POLY.to_bernstein()
+    for start, stop in GRIDS:
+        print("Grid on [{}, {}]".format(start, stop))
+        print("{:<32} {:>10} {:>12}".format("", "ms", "max error"))
+        args = (coeffs, start, stop, NUM_POINTS)
+        report("de_casteljau.compensated (loop)", de_casteljau_loop, args)
+        report(
+            "de_casteljau.compensated (array)", de_casteljau_batched, args
+        )
+        for anchor_every in (1, 8, forward_differences.DEFAULT_ANCHOR_EVERY):
+            name = "evaluate_grid (anchor={})".format(anchor_every)
+            report(
+                name, forward_differences.evaluate_grid, args + (anchor_every,)
+            )
+        print("")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,12 +32,10 @@ NUM_POINTS = 401
 def _main():
     s_vals = np.linspace(ROOT - DELTA_S, ROOT + DELTA_S, NUM_POINTS)
 
-    de_casteljau2 = []
+    de_casteljau2 = de_casteljau.compensated(s_vals, BEZIER_COEFFS)
     exact = []
 
     for s in s_vals:
-        de_casteljau2.append(de_casteljau.compensated(s, BEZIER_COEFFS))
-
         exact_s = F(s)
         exact_p = (2 * exact_s - 1) ** 3 * (exact_s - 1)
         exact.append(float(exact_p))
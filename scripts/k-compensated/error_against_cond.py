@@ -23,24 +23,19 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 import de_casteljau
+import eft
+import factored
 import plot_utils
 
 
 F = fractions.Fraction
 U = F(1, 2 ** 53)
-# p(s) = (s - 1) (s - 3/4)^7
-BEZIER_COEFFS = (
-    2187.0 / 16384.0,
-    -5103.0 / 131072.0,
-    729.0 / 65536.0,
-    -405.0 / 131072.0,
-    27.0 / 32768.0,
-    -27.0 / 131072.0,
-    3.0 / 65536.0,
-    -1.0 / 131072.0,
-    0.0,
-)
 ROOT = 0.75
+# p(s) = (s - 1) (s - 3/4)^7
+POLY = factored.FactoredPolynomial((1.0, ROOT), (1, 7))
+# p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
+POLY_TILDE = factored.FactoredPolynomial((1.0, 1.5), (1, 7), 2.0 ** -7)
+BEZIER_COEFFS = POLY.to_bernstein()
 POWER_VAL = 1.3
 ALPHA = 0.25
 
@@ -63,40 +58,32 @@ def main():
     forward_errs2 = []
     forward_errs3 = []
     forward_errs4 = []
-    for j in range(-5, -90 - 1, -1):
-        s = ROOT - POWER_VAL ** j
-        exact_s = F(s)
+    s_vals = np.array([ROOT - POWER_VAL ** j for j in range(-5, -90 - 1, -1)])
+    # Evaluate at every point (with every level of compensation) at once.
+    b, db, d2b, d3b = de_casteljau._compensated_k(s_vals, BEZIER_COEFFS, 4)
+    b2 = b + db
+    b3 = b2 + d2b
+    b4 = b3 + d3b
+    for index, s in enumerate(s_vals):
+        exact_s = eft.Dyadic.from_float(float(s))
 
         # Compute the condition number.
-        exact_p = (exact_s - 1) * (4 * exact_s - 3) ** 7 / 16384
-        # p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
-        exact_p_tilde = (exact_s - 1) * (2 * exact_s - 3) ** 7 / 16384
-        exact_cond = abs(exact_p_tilde / exact_p)
-        cond_nums.append(float(exact_cond))
+        exact_p = POLY.exact(exact_s)
+        exact_p_tilde = POLY_TILDE.exact(exact_s)
+        exact_cond = eft.dyadic_ratio(abs(exact_p_tilde), abs(exact_p))
+        cond_nums.append(exact_cond)
 
         # Compute the forward error for uncompensated de Casteljau.
-        b, db, d2b, d3b = de_casteljau._compensated_k(s, BEZIER_COEFFS, 4)
-        exact_b1 = F(b)
-        exact_forward_err1 = abs((exact_b1 - exact_p) / exact_p)
-        forward_errs1.append(float(exact_forward_err1))
+        forward_errs1.append(eft.relative_error(float(b[index]), exact_p))
 
         # Compute the forward error for compensated de Casteljau.
-        b2 = b + db
-        exact_b2 = F(b2)
-        exact_forward_err2 = abs((exact_b2 - exact_p) / exact_p)
-        forward_errs2.append(float(exact_forward_err2))
+        forward_errs2.append(eft.relative_error(float(b2[index]), exact_p))
 
         # Compute the forward error for K-compensated de Casteljau (K=3).
-        b3 = b2 + d2b
-        exact_b3 = F(b3)
-        exact_forward_err3 = abs((exact_b3 - exact_p) / exact_p)
-        forward_errs3.append(float(exact_forward_err3))
+        forward_errs3.append(eft.relative_error(float(b3[index]), exact_p))
 
         # Compute the forward error for K-compensated de Casteljau (K=3).
-        b4 = b3 + d3b
-        exact_b4 = F(b4)
-        exact_forward_err4 = abs((exact_b4 - exact_p) / exact_p)
-        forward_errs4.append(float(exact_forward_err4))
+        forward_errs4.append(eft.relative_error(float(b4[index]), exact_p))
 
     # Set a tight ``x``-limit.
     min_exp = np.log(min(cond_nums))
@@ -282,28 +269,24 @@ def main_jlcs10():
     cond_nums = []
     forward_errs1 = []
     forward_errs2 = []
-    for j in range(-5, -64 - 1, -1):
-        s = ROOT - POWER_VAL ** j
-        exact_s = F(s)
+    s_vals = np.array([ROOT - POWER_VAL ** j for j in range(-5, -64 - 1, -1)])
+    # Evaluate at every point (with every level of compensation) at once.
+    b, db = de_casteljau._compensated_k(s_vals, BEZIER_COEFFS, 2)
+    b2 = b + db
+    for index, s in enumerate(s_vals):
+        exact_s = eft.Dyadic.from_float(float(s))
 
         # Compute the condition number.
-        exact_p = (exact_s - 1) * (4 * exact_s - 3) ** 7 / 16384
-        # p_tilde(s) = SUM_j |b_j| B_{j, 8}(s) = (s - 1) (s/2 - 3/4)^7
-        exact_p_tilde = (exact_s - 1) * (2 * exact_s - 3) ** 7 / 16384
-        exact_cond = abs(exact_p_tilde / exact_p)
-        cond_nums.append(float(exact_cond))
+        exact_p = POLY.exact(exact_s)
+        exact_p_tilde = POLY_TILDE.exact(exact_s)
+        exact_cond = eft.dyadic_ratio(abs(exact_p_tilde), abs(exact_p))
+        cond_nums.append(exact_cond)
 
         # Compute the forward error for uncompensated de Casteljau.
-        b, db = de_casteljau._compensated_k(s, BEZIER_COEFFS, 2)
-        exact_b1 = F(b)
-        exact_forward_err1 = abs((exact_b1 - exact_p) / exact_p)
-        forward_errs1.append(float(exact_forward_err1))
+        forward_errs1.append(eft.relative_error(float(b[index]), exact_p))
 
         # Compute the forward error for compensated de Casteljau.
-        b2 = b + db
-        exact_b2 = F(b2)
-        exact_forward_err2 = abs((exact_b2 - exact_p) / exact_p)
-        forward_errs2.append(float(exact_forward_err2))
+        forward_errs2.append(eft.relative_error(float(b2[index]), exact_p))
 
     # Set a tight ``x``-limit.
     min_exp = np.log(min(cond_nums))
@@ -34,12 +34,8 @@ NUM_POINTS = 401
 def _main():
     s_vals = np.linspace(ROOT - DELTA_S, ROOT + DELTA_S, NUM_POINTS)
 
-    horner1 = []
-    de_casteljau1 = []
-
-    for s in s_vals:
-        horner1.append(horner.basic(s, POLY_COEFFS))
-        de_casteljau1.append(de_casteljau.basic(s, BEZIER_COEFFS))
+    horner1 = horner.basic_array(s_vals, POLY_COEFFS)
+    de_casteljau1 = de_casteljau.basic_array(s_vals, BEZIER_COEFFS)
 
     figure, (ax1, ax2) = plt.subplots(1, 2, sharex=True, sharey=True)
     ax1.plot(s_vals, horner1)
@@ -43,17 +43,10 @@ NUM_POINTS = 401
 def _main():
     s_vals = np.linspace(ROOT - DELTA_S, ROOT + DELTA_S, NUM_POINTS)
 
-    evaluated1 = []
-    evaluated2 = []
-    evaluated3 = []
-
-    for s in s_vals:
-        b, db, d2b = de_casteljau._compensated_k(s, BEZIER_COEFFS, 3)
-        evaluated1.append(b)
-        b2 = b + db
-        evaluated2.append(b2)
-        b3 = b2 + d2b
-        evaluated3.append(b3)
+    b, db, d2b = de_casteljau._compensated_k(s_vals, BEZIER_COEFFS, 3)
+    evaluated1 = b
+    evaluated2 = b + db
+    evaluated3 = evaluated2 + d2b
 
     figure, (ax1, ax2, ax3) = plt.subplots(1, 3, sharex=True)
     ax1.plot(s_vals, evaluated1)
@@ -0,0 +1,141 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Find all roots of a polynomial at once with the Aberth-Ehrlich method.
+
+Each root estimate :math:`z_k` is updated via
+
+.. math::
+
+    z_k \leftarrow z_k - \frac{p(z_k)}{p'(z_k) - p(z_k)
+        \sum_{j \neq k} \frac{1}{z_k - z_j}}
+
+which is Newton's method applied to :math:`p(z) / \prod_{j \neq k} (z -
+z_j)`, i.e. each estimate is repelled from the others so that distinct
+estimates don't converge to the same root. The values :math:`p(z_k)` and
+:math:`p'(z_k)` are computed with :func:`horner.compensated_complex_array`
+and :func:`horner.compensated_hd1_complex_array`.
+
+.. note::
+
+   To match :mod:`horner`, this assumes throughout that ``coeffs`` is
+   ordered from :math:`a_n` to :math:`a_0`.
+"""
+
+import collections
+
+import numpy as np
+
+import horner
+
+AberthResult = collections.namedtuple(
+    "AberthResult", ["roots", "converged", "iterations"]
+)
+# NOTE: ``roots`` is a 1D ``complex128`` array, ``converged`` a boolean
+#       array indicating which roots met the tolerance and
+#       ``iterations`` the number of updates applied to each root.
+
+
+def initial_estimates(coeffs):
+    r"""Compute starting values for :func:`roots`.
+
+    These are evenly spaced on a circle (rotated so that none are real)
+    with radius :math:`\left|a_0 / a_n\right|^{1 / n}`, i.e. the
+    geometric mean of the root magnitudes.
+
+    Args:
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The ``n`` starting values.
+    """
+    degree = len(coeffs) - 1
+    radius = abs(complex(coeffs[-1]) / complex(coeffs[0])) ** (1.0 / degree)
+    if radius == 0.0:
+        radius = 1.0
+    angles = 2.0 * np.pi * np.arange(degree) / degree + 0.4
+    return radius * np.exp(1j * angles)
+
+
+def _repulsion(z_vals):
+    # Helper for ``roots``; computes ``sum_{j != k} 1 / (z_k - z_j)``.
+    differences = z_vals[:, np.newaxis] - z_vals[np.newaxis, :]
+    np.fill_diagonal(differences, 1.0)
+    reciprocals = 1.0 / differences
+    np.fill_diagonal(reciprocals, 0.0)
+    return np.sum(reciprocals, axis=1)
+
+
+def roots(coeffs, x0=None, max_iter=100, tol=1e-15):
+    """Find all roots of a polynomial with the Aberth-Ehrlich method.
+
+    Every estimate is updated at once (i.e. a Jacobi-style iteration).
+    An estimate is frozen once the size of its update is at most ``tol``
+    relative to its size (or its value is exactly zero); frozen estimates
+    still repel the others.
+
+    Args:
+        coeffs (Sequence[Union[float, complex]]): The coefficients.
+        x0 (Optional[numpy.ndarray]): The ``n`` starting values. Defaults
+            to :func:`initial_estimates`.
+        max_iter (Optional[int]): The maximum number of iterations.
+        tol (Optional[float]): The relative tolerance for the update.
+
+    Returns:
+        AberthResult: The roots, which roots converged and the number of
+        iterations used for each root.
+
+    Raises:
+        ValueError: If the degree is less than 1.
+        ValueError: If the leading coefficient is zero.
+        ValueError: If ``x0`` does not have exactly one value per root.
+    """
+    degree = len(coeffs) - 1
+    if degree < 1:
+        raise ValueError("Expected a polynomial of degree at least 1", degree)
+    if coeffs[0] == 0:
+        raise ValueError("Expected a non-zero leading coefficient")
+
+    if x0 is None:
+        x0 = initial_estimates(coeffs)
+    z_vals = np.array(x0, dtype=np.complex128)
+    if z_vals.shape != (degree,):
+        raise ValueError("Expected one starting value per root", z_vals.shape)
+
+    coeffs = horner.HornerPolynomial(coeffs)
+    converged = np.zeros(degree, dtype=bool)
+    iterations = np.zeros(degree, dtype=int)
+    for _ in range(max_iter):
+        active = ~converged
+        if not np.any(active):
+            break
+
+        z_active = z_vals[active]
+        numerator = horner.compensated_complex_array(z_active, coeffs)
+        derivative = horner.compensated_hd1_complex_array(z_active, coeffs)
+        repulsion = _repulsion(z_vals)[active]
+        denominator = derivative - numerator * repulsion
+
+        # If the denominator is zero, just leave the estimate alone (the
+        # other estimates will still move).
+        safe = denominator != 0.0
+        update = np.zeros_like(z_active)
+        update[safe] = numerator[safe] / denominator[safe]
+
+        z_vals[active] = z_active - update
+        iterations[active] += 1
+        done = (numerator == 0.0) | (
+            safe & (np.abs(update) <= tol * np.abs(z_active))
+        )
+        converged[active] = done
+
+    return AberthResult(z_vals, converged, iterations)
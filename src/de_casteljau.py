@@ -37,6 +37,7 @@ This module provides both the standard version and a compensated version.
    :math:`p_n` to :math:`p_0`.
 """
 
+import numpy as np
 
 import eft
 
@@ -142,46 +143,209 @@ def _compensated_k(s, coeffs, K):
 
     only has to be in one sum. We avoid an extra sum because
     :math:`\widehat{r}` already has round-off error.
+
+    If ``s`` is a :class:`numpy.ndarray`, it is converted to ``float64``
+    and the whole cascade is done at every point at once via
+    :func:`_compensated_k_array` (and each level is an array with the
+    same shape as ``s``).
     """
+    if isinstance(s, np.ndarray):
+        s = np.asarray(s, dtype=np.float64)
+        return _compensated_k_array(s, coeffs, K)
+
     r, rho = eft.add_eft(1.0, -s)
 
     degree = len(coeffs) - 1
-    bk = {0: list(coeffs)}
-    # NOTE: This will be shared, but is read only.
-    all_zero = (0.0,) * (degree + 1)
+    # NOTE: ``bk`` is a single ``K x (degree + 1)`` workspace; during step
+    #       ``k`` each ``bk[F][j]`` is overwritten (in increasing ``j``)
+    #       once ``bk[F][j]`` and ``bk[F][j + 1]`` have been read.
+    bk = [list(coeffs)]
     for F in range(1, K - 1 + 1):
-        bk[F] = all_zero
+        bk.append([0.0] * (degree + 1))
+    # NOTE: The error terms are also updated in place. Level ``F`` has
+    #       ``3 + 5 F`` of them, so this has room for every level.
+    errors = [0.0] * (3 + 5 * max(K - 2, 0))
 
     for k in range(degree):
-        new_bk = {F: [] for F in range(K - 1 + 1)}
-
         for j in range(degree - k):
             # Update the "level 0" stuff.
-            P1, pi1 = eft.multiply_eft(r, bk[0][j])
-            P2, pi2 = eft.multiply_eft(s, bk[0][j + 1])
-            S3, sigma3 = eft.add_eft(P1, P2)
-            new_bk[0].append(S3)
-
-            errors = [pi1, pi2, sigma3]
             delta_b = bk[0][j]
+            P1, errors[0] = eft.multiply_eft(r, delta_b)
+            P2, errors[1] = eft.multiply_eft(s, bk[0][j + 1])
+            bk[0][j], errors[2] = eft.add_eft(P1, P2)
+            num_errs = 3
 
             for F in range(1, K - 2 + 1):
-                new_errors, l_hat = local_error_eft(errors, rho, delta_b)
-                P1, pi1 = eft.multiply_eft(s, bk[F][j + 1])
-                S2, sigma2 = eft.add_eft(l_hat, P1)
-                P3, pi3 = eft.multiply_eft(r, bk[F][j])
-                S, sigma4 = eft.add_eft(S2, P3)
-                new_bk[F].append(S)
-
-                new_errors.extend([pi1, sigma2, pi3, sigma4])
-                errors = new_errors
+                # Compute ``local_error_eft(errors, rho, delta_b)``.
+                l_hat, errors[0] = eft.add_eft(errors[0], errors[1])
+                for i in range(2, num_errs):
+                    l_hat, errors[i - 1] = eft.add_eft(l_hat, errors[i])
+                prod, errors[num_errs - 1] = eft.multiply_eft(rho, delta_b)
+                l_hat, errors[num_errs] = eft.add_eft(l_hat, prod)
+
                 delta_b = bk[F][j]
+                P1, errors[num_errs + 1] = eft.multiply_eft(s, bk[F][j + 1])
+                S2, errors[num_errs + 2] = eft.add_eft(l_hat, P1)
+                P3, errors[num_errs + 3] = eft.multiply_eft(r, delta_b)
+                bk[F][j], errors[num_errs + 4] = eft.add_eft(S2, P3)
+                num_errs += 5
 
             # Update the "level 2" stuff.
-            l_hat = local_error(errors, rho, delta_b)
-            new_bk[K - 1].append(
-                l_hat + s * bk[K - 1][j + 1] + r * bk[K - 1][j]
-            )
+            # NOTE: This is ``local_error(errors, rho, delta_b)``.
+            l_hat = errors[0] + errors[1]
+            for i in range(2, num_errs):
+                l_hat += errors[i]
+            l_hat += rho * delta_b
+            bk[K - 1][j] = l_hat + s * bk[K - 1][j + 1] + r * bk[K - 1][j]
+
+    return tuple(bk[F][0] for F in range(K - 1 + 1))
+
+
+def _basic_array(s, coeffs):
+    # Vectorized version of ``basic``; keeps the ``dtype`` of ``s``.
+    r = 1 - s
+
+    degree = len(coeffs) - 1
+    pk = np.empty((degree + 1,) + s.shape, dtype=s.dtype)
+    for j, coeff in enumerate(coeffs):
+        pk[j] = coeff
+    for k in range(degree):
+        pk = r * pk[:-1] + s * pk[1:]
+
+    return pk[0]
+
+
+def _reduce_in_place(s, r, workspace, scratch, degree):
+    # Helper for ``basic_array`` and ``derivative_array``. Performs
+    # ``degree`` steps of de Casteljau on the first ``degree + 1`` rows
+    # of ``workspace`` (one column per point), leaving the result in the
+    # first row.
+    for k in range(degree):
+        num_rows = degree - k
+        current = workspace[:num_rows]
+        # NOTE: ``s * pk[j + 1]`` must be computed before ``pk[j + 1]``
+        #       is overwritten with ``r * pk[j + 1]``.
+        np.multiply(s, workspace[1 : num_rows + 1], out=scratch[:num_rows])
+        np.multiply(r, current, out=current)
+        np.add(current, scratch[:num_rows], out=current)
+
+
+def _workspace(s, degree):
+    # Helper for ``basic_array`` and ``derivative_array``.
+    s = np.asarray(s, dtype=np.float64)
+    s_flat = s.ravel()
+    workspace = np.empty((degree + 1, s_flat.size))
+    scratch = np.empty((degree, s_flat.size))
+    return s, s_flat, 1 - s_flat, workspace, scratch
+
+
+def basic_array(s, coeffs):
+    """Perform the "standard" de Casteljau algorithm at an array of points.
+
+    A single ``(degree + 1, num_points)`` workspace (and a scratch buffer
+    of about the same size) is allocated up front and each step of the
+    algorithm reduces it in place, so no memory is allocated per step.
+    Each row holds one coefficient for every point, so every update is
+    on contiguous memory.
+
+    Args:
+        s (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``s``. Each value is identical to the one computed by
+        :func:`basic`.
+    """
+    degree = len(coeffs) - 1
+    s, s_flat, r_flat, workspace, scratch = _workspace(s, degree)
+    workspace[:, :] = np.asarray(coeffs, dtype=np.float64)[:, np.newaxis]
+    _reduce_in_place(s_flat, r_flat, workspace, scratch, degree)
+    return workspace[0].reshape(s.shape)
+
+
+def derivative_array(s, coeffs):
+    """Compute the derivative via de Casteljau at an array of points.
+
+    Uses the same in-place reduction as :func:`basic_array`.
+
+    Args:
+        s (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the derivative, with the same shape
+        as ``s``. Each value is identical to the one computed by
+        :func:`derivative`.
+    """
+    degree = len(coeffs) - 1
+    s, s_flat, r_flat, workspace, scratch = _workspace(s, degree - 1)
+    delta_b = np.diff(np.asarray(coeffs, dtype=np.float64))
+    workspace[:, :] = delta_b[:, np.newaxis]
+    _reduce_in_place(s_flat, r_flat, workspace, scratch, degree - 1)
+    return (degree * workspace[0]).reshape(s.shape)
+
+
+def _local_error_eft_array(errors, rho, delta_b):
+    # Vectorized version of ``local_error_eft``.
+    num_errs = len(errors)
+    new_errors = [None] * (num_errs + 1)
+
+    l_hat, new_errors[0] = eft.add_eft_array(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, new_errors[j - 1] = eft.add_eft_array(l_hat, errors[j])
+
+    prod, new_errors[num_errs - 1] = eft.multiply_eft_array(rho, delta_b)
+    l_hat, new_errors[num_errs] = eft.add_eft_array(l_hat, prod)
+
+    return new_errors, l_hat
+
+
+def _compensated_k_array(s, coeffs, K):
+    """Vectorized version of :func:`_compensated_k`.
+
+    This evaluates at an array of points ``s`` and keeps the ``dtype``
+    of ``s`` (which should match ``coeffs``). Within each step
+    :math:`k` of de Casteljau's method, every :math:`j` is updated at
+    once, so the ``bk[F]`` are arrays of shape ``(degree + 1 - k,) +
+    s.shape``. The operations on each entry are exactly those done by
+    :func:`_compensated_k`.
+    """
+    one = np.ones_like(s)
+    r, rho = eft.add_eft_array(one, -s)
+
+    degree = len(coeffs) - 1
+    bk = {0: np.empty((degree + 1,) + s.shape, dtype=s.dtype)}
+    for j, coeff in enumerate(coeffs):
+        bk[0][j] = coeff
+    for F in range(1, K - 1 + 1):
+        bk[F] = np.zeros_like(bk[0])
+
+    for k in range(degree):
+        new_bk = {}
+
+        # Update the "level 0" stuff.
+        P1, pi1 = eft.multiply_eft_array(r, bk[0][:-1])
+        P2, pi2 = eft.multiply_eft_array(s, bk[0][1:])
+        new_bk[0], sigma3 = eft.add_eft_array(P1, P2)
+
+        errors = [pi1, pi2, sigma3]
+        delta_b = bk[0][:-1]
+
+        for F in range(1, K - 2 + 1):
+            new_errors, l_hat = _local_error_eft_array(errors, rho, delta_b)
+            P1, pi1 = eft.multiply_eft_array(s, bk[F][1:])
+            S2, sigma2 = eft.add_eft_array(l_hat, P1)
+            P3, pi3 = eft.multiply_eft_array(r, bk[F][:-1])
+            new_bk[F], sigma4 = eft.add_eft_array(S2, P3)
+
+            new_errors.extend([pi1, sigma2, pi3, sigma4])
+            errors = new_errors
+            delta_b = bk[F][:-1]
+
+        # Update the "level 2" stuff.
+        l_hat = local_error(errors, rho, delta_b)
+        new_bk[K - 1] = l_hat + s * bk[K - 1][1:] + r * bk[K - 1][:-1]
 
         # Update the "current" values.
         bk = new_bk
@@ -189,24 +353,82 @@ def _compensated_k(s, coeffs, K):
     return tuple(bk[F][0] for F in range(K - 1 + 1))
 
 
+def _sum_levels(levels, K):
+    # Helper for ``compensated``, ``compensated3``, etc.; ``levels`` are
+    # either all scalars or all arrays (when ``s`` is an array).
+    if isinstance(levels[0], np.ndarray):
+        return eft.sum_k_array(np.stack(levels), K)
+    return eft.sum_k(levels, K)
+
+
 def compensated(s, coeffs):
     b, db = _compensated_k(s, coeffs, 2)
-    return eft.sum_k((b, db), 2)
+    return _sum_levels((b, db), 2)
 
 
 def compensated3(s, coeffs):
     b, db, d2b = _compensated_k(s, coeffs, 3)
-    return eft.sum_k((b, db, d2b), 3)
+    return _sum_levels((b, db, d2b), 3)
 
 
 def compensated4(s, coeffs):
     b, db, d2b, d3b = _compensated_k(s, coeffs, 4)
-    return eft.sum_k((b, db, d2b, d3b), 4)
+    return _sum_levels((b, db, d2b, d3b), 4)
 
 
 def compensated5(s, coeffs):
     b, db, d2b, d3b, d4b = _compensated_k(s, coeffs, 5)
-    return eft.sum_k((b, db, d2b, d3b, d4b), 5)
+    return _sum_levels((b, db, d2b, d3b, d4b), 5)
+
+
+def basic_multi(s, coeffs):
+    """Perform the "standard" de Casteljau for many polynomials at once.
+
+    Args:
+        s (Union[float, numpy.ndarray]): The point to evaluate at. Either
+            a single point shared by all polynomials or a 1D array with
+            one point per polynomial.
+        coeffs (numpy.ndarray): A 2D array of Bernstein coefficients,
+            with one row per polynomial.
+
+    Returns:
+        numpy.ndarray: The 1D array of values, one per polynomial. Each
+        value is identical to the one computed by :func:`basic`.
+
+    Raises:
+        ValueError: If ``coeffs`` is not 2D.
+        ValueError: If ``s`` is not a single point or 1D with one point
+            per polynomial.
+    """
+    s, columns = eft._multi_args(s, coeffs)
+    return _basic_array(s, columns)
+
+
+def compensated_multi(s, coeffs, K=2):
+    """Perform K-compensated de Casteljau for many polynomials at once.
+
+    Args:
+        s (Union[float, numpy.ndarray]): The point to evaluate at. Either
+            a single point shared by all polynomials or a 1D array with
+            one point per polynomial.
+        coeffs (numpy.ndarray): A 2D array of Bernstein coefficients,
+            with one row per polynomial.
+        K (Optional[int]): The number of compensation levels; must be at
+            least 2. Defaults to 2.
+
+    Returns:
+        numpy.ndarray: The 1D array of values, one per polynomial. Each
+        value is identical to the one computed by :func:`compensated`
+        (or :func:`compensated3`, etc. when ``K > 2``).
+
+    Raises:
+        ValueError: If ``coeffs`` is not 2D.
+        ValueError: If ``s`` is not a single point or 1D with one point
+            per polynomial.
+    """
+    s, columns = eft._multi_args(s, coeffs)
+    levels = _compensated_k_array(s, columns, K)
+    return eft.sum_k_array(np.stack(levels), K)
 
 
 def pre_compensated_derivative(coeffs):
@@ -329,3 +551,29 @@ def full_newton(s0, coeffs, max_iter=100, tol=1e-15):
         curr_s = next_s
 
     return curr_s
+
+
+def compensated_newton_update(s, coeffs, pk, err_k):
+    """Perform a Newton update that carries errors through the quotient."""
+    numerator, numerator_err = _compensated_k(s, coeffs, 2)
+    denominator = compensated_derivative(s, pk, err_k)
+    if denominator == 0.0:
+        # If there is a division-by-zero, just give up.
+        return s
+
+    quotient, remainder = eft.divide_eft(numerator, denominator)
+    correction = (remainder + numerator_err) / denominator
+    next_s, error = eft.add_eft(s, -quotient)
+    return next_s + (error - correction)
+
+
+def compensated_newton(s0, coeffs, max_iter=100, tol=1e-15):
+    curr_s = s0
+    pk, err_k = pre_compensated_derivative(coeffs)
+    for _ in range(max_iter):
+        next_s = compensated_newton_update(curr_s, coeffs, pk, err_k)
+        if abs(next_s - curr_s) < tol:
+            return next_s
+        curr_s = next_s
+
+    return curr_s
@@ -0,0 +1,217 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Double-double arithmetic built on error-free transforms.
+
+A double-double value is an unevaluated sum :math:`x_h + x_{\ell}` of
+two floats with :math:`\left|x_{\ell}\right| \leq \frac{1}{2}
+\operatorname{ulp}\left(x_h\right)`, which gives roughly twice the
+precision of a ``float``.
+
+.. _JMP17: https://doi.org/10.1145/3121432
+
+The algorithms used are ``AccurateDWPlusDW``, ``DWPlusFP``,
+``DWTimesFP`` and ``DWTimesDW`` from `JMP17`_ (with the FMA-s replaced
+by a multiply and add in the last two).
+"""
+
+import numpy as np
+
+import eft
+
+
+def _fast_add_eft(val1, val2):
+    # Fast2Sum: assumes the exponent of ``val1`` is at least that of
+    # ``val2``. Works on both scalars and arrays.
+    sum_ = val1 + val2
+    return sum_, val2 - (sum_ - val1)
+
+
+def _add_dd(high1, low1, high2, low2, add_eft):
+    # Helper for ``DoubleDouble`` and ``DoubleDoubleArray``.
+    # NOTE: This is ``AccurateDWPlusDW``.
+    s_high, s_low = add_eft(high1, high2)
+    t_high, t_low = add_eft(low1, low2)
+    v_high, v_low = _fast_add_eft(s_high, s_low + t_high)
+    return _fast_add_eft(v_high, t_low + v_low)
+
+
+def _add_fp(high, low, val, add_eft):
+    # Helper for ``DoubleDouble`` and ``DoubleDoubleArray``.
+    # NOTE: This is ``DWPlusFP``.
+    s_high, s_low = add_eft(high, val)
+    return _fast_add_eft(s_high, low + s_low)
+
+
+def _multiply_fp(high, low, val, multiply_eft):
+    # Helper for ``DoubleDouble`` and ``DoubleDoubleArray``.
+    # NOTE: This is ``DWTimesFP``.
+    c_high, c_low = multiply_eft(high, val)
+    return _fast_add_eft(c_high, low * val + c_low)
+
+
+def _multiply_dd(high1, low1, high2, low2, multiply_eft):
+    # Helper for ``DoubleDouble`` and ``DoubleDoubleArray``.
+    # NOTE: This is ``DWTimesDW``.
+    c_high, c_low = multiply_eft(high1, high2)
+    t_low = high1 * low2 + low1 * low2
+    return _fast_add_eft(c_high, c_low + (low1 * high2 + t_low))
+
+
+class DoubleDouble(object):
+    """A double-double scalar.
+
+    Args:
+        high (float): The leading part of the value.
+        low (Optional[float]): The trailing part of the value. It is
+            assumed that ``high + low == high``, i.e. the pair is
+            already normalized.
+    """
+
+    __slots__ = ("high", "low")
+
+    def __init__(self, high, low=0.0):
+        self.high = high
+        self.low = low
+
+    def __repr__(self):
+        return "DoubleDouble({!r}, {!r})".format(self.high, self.low)
+
+    def __float__(self):
+        return self.high + self.low
+
+    def __neg__(self):
+        return DoubleDouble(-self.high, -self.low)
+
+    def __add__(self, other):
+        if isinstance(other, DoubleDoubleArray):
+            return NotImplemented
+        if isinstance(other, DoubleDouble):
+            high, low = _add_dd(
+                self.high, self.low, other.high, other.low, eft.add_eft
+            )
+        else:
+            high, low = _add_fp(self.high, self.low, other, eft.add_eft)
+        return DoubleDouble(high, low)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, DoubleDoubleArray):
+            return NotImplemented
+        if isinstance(other, DoubleDouble):
+            high, low = _multiply_dd(
+                self.high, self.low, other.high, other.low, eft.multiply_eft
+            )
+        else:
+            high, low = _multiply_fp(
+                self.high, self.low, other, eft.multiply_eft
+            )
+        return DoubleDouble(high, low)
+
+    __rmul__ = __mul__
+
+    def fma(self, multiplier, addend):
+        """Compute ``self * multiplier + addend``.
+
+        This is the update used in (compensated) Horner's method.
+        """
+        return self * multiplier + addend
+
+
+class DoubleDoubleArray(object):
+    """An array of double-double values.
+
+    Args:
+        high (numpy.ndarray): The leading parts of the values.
+        low (Optional[numpy.ndarray]): The trailing parts of the values.
+            Defaults to all zeros.
+    """
+
+    __slots__ = ("high", "low")
+
+    def __init__(self, high, low=None):
+        self.high = np.asarray(high, dtype=float)
+        if low is None:
+            low = np.zeros_like(self.high)
+        self.low = np.asarray(low, dtype=float)
+
+    def __repr__(self):
+        return "DoubleDoubleArray({!r}, {!r})".format(self.high, self.low)
+
+    def __len__(self):
+        return len(self.high)
+
+    def __getitem__(self, index):
+        high = self.high[index]
+        low = self.low[index]
+        if np.ndim(high) == 0:
+            return DoubleDouble(float(high), float(low))
+        return DoubleDoubleArray(high, low)
+
+    @property
+    def shape(self):
+        return self.high.shape
+
+    def to_float(self):
+        """Round each value to the nearest ``float``."""
+        return self.high + self.low
+
+    def __neg__(self):
+        return DoubleDoubleArray(-self.high, -self.low)
+
+    def __add__(self, other):
+        if isinstance(other, (DoubleDouble, DoubleDoubleArray)):
+            high, low = _add_dd(
+                self.high, self.low, other.high, other.low, eft.add_eft_array
+            )
+        else:
+            high, low = _add_fp(self.high, self.low, other, eft.add_eft_array)
+        return DoubleDoubleArray(high, low)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, (DoubleDouble, DoubleDoubleArray)):
+            high, low = _multiply_dd(
+                self.high,
+                self.low,
+                other.high,
+                other.low,
+                eft.multiply_eft_array,
+            )
+        else:
+            high, low = _multiply_fp(
+                self.high, self.low, other, eft.multiply_eft_array
+            )
+        return DoubleDoubleArray(high, low)
+
+    __rmul__ = __mul__
+
+    def fma(self, multiplier, addend):
+        """Compute ``self * multiplier + addend`` elementwise.
+
+        This is the update used in (compensated) Horner's method.
+        """
+        return self * multiplier + addend
@@ -13,7 +13,21 @@
 """Collection of error-free transforms."""
 
 
+import collections
 import fractions
+import functools
+import math
+import multiprocessing
+import os
+import random
+import sys
+
+import numpy as np
+
+try:
+    import gmpy2
+except ImportError:  # pragma: NO COVER
+    gmpy2 = None
 
 
 def add_eft(val1, val2):
@@ -26,24 +40,313 @@ def add_eft(val1, val2):
 
 def _split(val):
     # Helper for ``multiply_eft``.
-    scaled = val * 134217729.0  # 134217729 == 2^{27} + 1.
+    if isinstance(val, (int, float)):
+        scaled = val * 134217729.0  # 134217729 == 2^{27} + 1.
+    else:
+        scaled = val * numeric_traits(val).splitter
     high_bits = scaled - (scaled - val)
     low_bits = val - high_bits
     return high_bits, low_bits
 
 
+def _fma_fraction(val1, val2, val3):
+    # Reference implementation: exact, but builds three ``Fraction``-s.
+    frac1 = fractions.Fraction(val1)
+    frac2 = fractions.Fraction(val2)
+    frac3 = fractions.Fraction(val3)
+    return float(frac1 * frac2 + frac3)
+
+
+def _fma_integer(val1, val2, val3):
+    """Exact FMA via integer mantissas.
+
+    Every finite ``float`` is ``numer / denom`` with ``denom`` a power
+    of two, so the exact result is also such a ratio. Since integer true
+    division is correctly rounded, this avoids the ``gcd`` normalization
+    done by ``Fraction``.
+    """
+    if not (math.isfinite(val1) and math.isfinite(val2)):
+        return val1 * val2 + val3
+    if not math.isfinite(val3):
+        return val3
+
+    numer1, denom1 = val1.as_integer_ratio()
+    numer2, denom2 = val2.as_integer_ratio()
+    numer3, denom3 = val3.as_integer_ratio()
+    denom12 = denom1 * denom2
+    if denom12 >= denom3:
+        numer = numer1 * numer2 + numer3 * (denom12 // denom3)
+        denom = denom12
+    else:
+        numer = numer1 * numer2 * (denom3 // denom12) + numer3
+        denom = denom3
+
+    if numer == 0:
+        # NOTE: When the exact result is zero, the product is exactly
+        #       ``-val3`` so this is exact and gets the sign of zero right.
+        return val1 * val2 + val3
+
+    try:
+        return numer / denom
+    except OverflowError:
+        return math.inf if numer > 0 else -math.inf
+
+
+# NOTE: These are in order of preference; ``math.fma`` was added in
+#       Python 3.13.
+_FMA_BACKENDS = (
+    ("math", getattr(math, "fma", None)),
+    ("integer", _fma_integer),
+    ("fraction", _fma_fraction),
+)
+_FMA_NAME = None
+_FMA_IMPL = None
+
+
+def _fma_check_cases():
+    # Helper for ``_fma_self_check``.
+    # NOTE: Uses a fixed seed so every backend sees the same cases.
+    rng = random.Random(0)
+    cases = [
+        (0.1, 0.3, -0.03),
+        (1.0 + 2.0 ** -52, 1.0 + 2.0 ** -52, -1.0),
+        (1.0 + 2.0 ** -52, 1.0 - 2.0 ** -53, -1.0),
+        (2.0 ** -600, 2.0 ** -470, 2.0 ** -1074),
+        (3.0 * 2.0 ** -540, 5.0 * 2.0 ** -530, 0.0),
+        (-1.5, 2.0, 3.0),
+        (0.0, -1.0, 0.0),
+    ]
+    for _ in range(64):
+        val1 = math.ldexp(rng.uniform(-1.0, 1.0), rng.randint(-500, 500))
+        val2 = math.ldexp(rng.uniform(-1.0, 1.0), rng.randint(-500, 500))
+        val3 = -val1 * val2 * rng.choice((1.0, 1.0 + 2.0 ** -40))
+        cases.append((val1, val2, val3))
+
+    return cases
+
+
+def _fma_self_check(fma_impl):
+    """Check an FMA implementation against the ``Fraction`` reference."""
+    for val1, val2, val3 in _fma_check_cases():
+        expected = _fma_fraction(val1, val2, val3)
+        if fma_impl(val1, val2, val3).hex() != expected.hex():
+            return False
+
+    return True
+
+
+def get_fma_backend():
+    """Get the name of the FMA backend used by :func:`multiply_eft`."""
+    return _FMA_NAME
+
+
+def set_fma_backend(name=None):
+    """Set the FMA backend used by :func:`multiply_eft`.
+
+    If ``name`` is :data:`None`, the first available backend in
+    :data:`_FMA_BACKENDS` that passes :func:`_fma_self_check` is used.
+    This is done at import time.
+
+    Args:
+        name (Optional[str]): One of ``"math"``, ``"integer"`` or
+            ``"fraction"``.
+
+    Returns:
+        str: The name of the backend that was selected.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend, is not available
+            in this interpreter or fails the self-check.
+    """
+    global _FMA_NAME, _FMA_IMPL
+
+    for backend_name, fma_impl in _FMA_BACKENDS:
+        if name is not None and backend_name != name:
+            continue
+        if fma_impl is None or not _fma_self_check(fma_impl):
+            if name is None:
+                continue
+            raise ValueError("FMA backend is not usable", name)
+
+        _FMA_NAME = backend_name
+        _FMA_IMPL = fma_impl
+        return backend_name
+
+    raise ValueError("Unknown FMA backend", name)
+
+
 def _fma(val1, val2, val3):
     if (
         isinstance(val1, float)
         and isinstance(val2, float)
         and isinstance(val3, float)
     ):
-        frac1 = fractions.Fraction(val1)
-        frac2 = fractions.Fraction(val2)
-        frac3 = fractions.Fraction(val3)
-        return float(frac1 * frac2 + frac3)
+        return _FMA_IMPL(val1, val2, val3)
+
+    for val in (val1, val2, val3):
+        if not isinstance(val, (int, float)):
+            return numeric_traits(val).fma(val1, val2, val3)
+    # NOTE: Python ``int``-s mixed with ``float``-s are coerced to ``float``.
+    return _fma_float(val1, val2, val3)
+
+
+def _fma_float(val1, val2, val3):
+    # Helper for ``_fma`` and ``numeric_traits``; uses the current backend.
+    return _FMA_IMPL(float(val1), float(val2), float(val3))
+
+
+# NOTE: ``precision`` is the number of bits p in the significand,
+#       ``splitter`` is 2^{ceil(p / 2)} + 1 (for Dekker's split) and
+#       ``unit_roundoff`` is 2^{-p}; both have the same type as the values.
+#       ``fma`` is a correctly rounded ``fma(val1, val2, val3)``.
+NumericTraits = collections.namedtuple(
+    "NumericTraits", ["precision", "splitter", "unit_roundoff", "fma"]
+)
+
+
+def _make_traits(precision, convert, fma_impl):
+    # Helper for ``numeric_traits``.
+    splitter = convert(2 ** ((precision + 1) // 2) + 1)
+    unit_roundoff = convert(2) ** -precision
+    return NumericTraits(precision, splitter, unit_roundoff, fma_impl)
+
+
+def _round_ratio(numer, denom, precision, min_exponent):
+    # Helper for ``_fma_numpy``; rounds ``numer / denom`` (``denom`` a
+    # power of two) to nearest as ``(mantissa, exponent)``.
+    sign = -1 if numer < 0 else 1
+    numer = abs(numer)
+    shift = denom.bit_length() - 1
+    exponent = max(numer.bit_length() - shift - precision, min_exponent)
+
+    total_shift = shift + exponent
+    if total_shift <= 0:
+        return sign * (numer << -total_shift), exponent
+
+    mantissa, remainder = divmod(numer, 1 << total_shift)
+    half = 1 << (total_shift - 1)
+    if remainder > half or (remainder == half and mantissa % 2 == 1):
+        mantissa += 1
+
+    return sign * mantissa, exponent
+
+
+def _integer_ratio(val, precision):
+    # Helper for ``_fma_numpy``; the exact ``(numer, denom)`` of a finite
+    # NumPy scalar. Older NumPy scalars don't have ``as_integer_ratio``
+    # and ``float(val)`` would round a ``longdouble``.
+    value_type = type(val)
+    fraction, exponent = np.frexp(val)
+    # NOTE: This is an integer (exactly); it is converted (at most) 32
+    #       bits at a time so that each piece is exact as a ``float``.
+    scaled = abs(np.ldexp(fraction, precision))
+    piece_bits = min(precision, 32)
+    piece_size = value_type(2 ** piece_bits)
+    numer = 0
+    shift = 0
+    while scaled != 0:
+        piece = np.fmod(scaled, piece_size)
+        numer += int(float(piece)) << shift
+        scaled = (scaled - piece) / piece_size
+        shift += piece_bits
+    if fraction < 0:
+        numer = -numer
+
+    exponent = int(exponent) - precision
+    if exponent >= 0:
+        return numer << exponent, 1
+    return numer, 1 << -exponent
+
+
+def _fma_numpy(val1, val2, val3):
+    # Exact FMA for NumPy floating point scalars, via integer mantissas.
+    value_type = type(val1)
+    val2 = value_type(val2)
+    val3 = value_type(val3)
+    if not (np.isfinite(val1) and np.isfinite(val2) and np.isfinite(val3)):
+        return value_type(val1 * val2 + val3)
+
+    info = np.finfo(value_type)
+    precision = info.nmant + 1
+    numer1, denom1 = _integer_ratio(val1, precision)
+    numer2, denom2 = _integer_ratio(val2, precision)
+    numer3, denom3 = _integer_ratio(val3, precision)
+    denom = max(denom1 * denom2, denom3)
+    numer = numer1 * numer2 * (denom // (denom1 * denom2)) + numer3 * (
+        denom // denom3
+    )
+    if numer == 0:
+        return value_type(val1 * val2 + val3)
+
+    mantissa, exponent = _round_ratio(
+        numer, denom, precision, info.minexp - precision + 1
+    )
+    # NOTE: Split the mantissa so that each piece is exactly representable
+    #       regardless of how NumPy converts large integers.
+    high, low = divmod(abs(mantissa), 2 ** 32)
+    result = np.ldexp(value_type(high), 32) + value_type(low)
+    with np.errstate(over="ignore"):
+        result = np.ldexp(result, exponent)
+    if mantissa < 0:
+        return -result
+    return result
+
+
+def _fma_float64(val1, val2, val3):
+    # Helper for ``numeric_traits``; defers to the current backend.
+    return np.float64(_fma_float(val1, val2, val3))
+
+
+def _fma_mpmath(val1, val2, val3):
+    # Helper for ``numeric_traits``.
+    ctx = val1.context
+    return ctx.fadd(ctx.fmul(val1, val2, exact=True), val3)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_traits(value_type):
+    # Helper for ``numeric_traits``.
+    if value_type is np.float64:
+        fma_impl = _fma_float64
     else:
-        return val1.fma(val1, val2, val3)
+        fma_impl = _fma_numpy
+    precision = np.finfo(value_type).nmant + 1
+    return _make_traits(precision, value_type, fma_impl)
+
+
+@functools.lru_cache(maxsize=None)
+def _mpmath_traits(ctx, precision):
+    # Helper for ``numeric_traits``.
+    return _make_traits(precision, ctx.mpf, _fma_mpmath)
+
+
+@functools.lru_cache(maxsize=None)
+def _gmpy2_traits(precision):
+    # Helper for ``numeric_traits``.
+    return _make_traits(precision, gmpy2.mpfr, gmpy2.fma)
+
+
+def numeric_traits(value):
+    """Get the :class:`NumericTraits` for the type of ``value``.
+
+    Raises:
+        TypeError: If the type of ``value`` is not supported.
+    """
+    if isinstance(value, float) and not isinstance(value, np.floating):
+        return _FLOAT_TRAITS
+    if isinstance(value, np.floating):
+        return _numpy_traits(type(value))
+    if gmpy2 is not None and isinstance(value, gmpy2.mpfr):
+        return _gmpy2_traits(gmpy2.get_context().precision)
+    if hasattr(value, "_mpf_") and hasattr(value, "context"):
+        # NOTE: Each ``mpmath`` context has its own ``mpf`` subclass.
+        ctx = value.context
+        return _mpmath_traits(ctx, ctx.prec)
+
+    raise TypeError("Unsupported numeric type", type(value))
+
+
+_FLOAT_TRAITS = _make_traits(53, float, _fma_float)
 
 
 def multiply_eft(val1, val2, use_fma=True):
@@ -61,6 +364,48 @@ def multiply_eft(val1, val2, use_fma=True):
     return product, error
 
 
+def divide_eft(val1, val2, use_fma=True):
+    # See: Bohlender, Walter, Kornerup and Matula (ARITH 10, 1991).
+    # NOTE: ``val1 == quotient * val2 + remainder`` exactly.
+    quotient = val1 / val2
+    product, error = multiply_eft(quotient, val2, use_fma=use_fma)
+    remainder = (val1 - product) - error
+    return quotient, remainder
+
+
+def sqrt_eft(val, use_fma=True):
+    # See: Bohlender, Walter, Kornerup and Matula (ARITH 10, 1991).
+    # NOTE: ``val == root * root + remainder`` exactly.
+    root = math.sqrt(val)
+    product, error = multiply_eft(root, root, use_fma=use_fma)
+    remainder = (val - product) - error
+    return root, remainder
+
+
+def add_eft_complex(val1, val2):
+    # NOTE: Applies ``add_eft`` to the real and imaginary parts.
+    real, real_err = add_eft(val1.real, val2.real)
+    imag, imag_err = add_eft(val1.imag, val2.imag)
+    return complex(real, imag), complex(real_err, imag_err)
+
+
+def multiply_eft_complex(val1, val2, use_fma=True):
+    # See: Graillat and Menissier-Morain, Inf. Comput. 216 (2012).
+    # NOTE: ``val1 * val2 == product + error1 + error2 + error3`` exactly.
+    z1, h1 = multiply_eft(val1.real, val2.real, use_fma=use_fma)
+    z2, h2 = multiply_eft(val1.imag, val2.imag, use_fma=use_fma)
+    z3, h3 = multiply_eft(val1.real, val2.imag, use_fma=use_fma)
+    z4, h4 = multiply_eft(val1.imag, val2.real, use_fma=use_fma)
+    z5, h5 = add_eft(z1, -z2)
+    z6, h6 = add_eft(z3, z4)
+    return (
+        complex(z5, z6),
+        complex(h1, h3),
+        complex(-h2, h4),
+        complex(h5, h6),
+    )
+
+
 def _vec_sum(p):
     # See: https://doi.org/10.1137/030601818
     # Helper for ``sum_k``.
@@ -82,3 +427,815 @@ def sum_k(p, k):
         result += p_val
 
     return result
+
+
+def add_eft_array(val1, val2):
+    """Vectorized version of :func:`add_eft`.
+
+    Operates elementwise (with broadcasting) on ``float64`` arrays and
+    performs the same sequence of operations, so the results agree bit
+    for bit with :func:`add_eft`.
+    """
+    val1 = np.asarray(val1)
+    val2 = np.asarray(val2)
+    sum_ = val1 + val2
+    delta1 = sum_ - val1
+    error = (val1 - (sum_ - delta1)) + (val2 - delta1)
+    return sum_, error
+
+
+@functools.lru_cache(maxsize=None)
+def _dekker_bounds(dtype):
+    # Helper for ``multiply_eft_array``.
+    info = np.finfo(dtype)
+    precision = info.nmant + 1
+    max_exponent = info.maxexp - (precision + 1) // 2 - 2
+    min_exponent = info.minexp + precision + 1
+    one = dtype.type(1)
+    return np.ldexp(one, max_exponent), np.ldexp(one, min_exponent)
+
+
+def _split_array(val):
+    # Helper for ``multiply_eft_array``.
+    if val.dtype == np.float64:
+        scaled = val * 134217729.0  # 134217729 == 2^{27} + 1.
+    else:
+        scaled = val * _numpy_traits(val.dtype.type).splitter
+    high_bits = scaled - (scaled - val)
+    low_bits = val - high_bits
+    return high_bits, low_bits
+
+
+def _dekker_error_array(val1, val2, product):
+    # Helper for ``multiply_eft_array``.
+    high1, low1 = _split_array(val1)
+    high2, low2 = _split_array(val2)
+    return low1 * low2 - (
+        ((product - high1 * high2) - low1 * high2) - high1 * low2
+    )
+
+
+def multiply_eft_array(val1, val2, use_fma=True):
+    """Vectorized version of :func:`multiply_eft`.
+
+    NumPy does not provide an FMA, but the product error is exactly
+    representable so Dekker's product computes the same value as
+    ``fma(val1, val2, -product)`` whenever it does not overflow or
+    underflow. When ``use_fma=True``, only the (rare) entries outside of
+    that range are sent through :func:`_fma` one at a time. Non-finite
+    entries are left as computed by Dekker's product. For finite inputs
+    and products, the results agree bit for bit (including the sign of
+    a zero error) with :func:`multiply_eft`.
+
+    For ``float32`` arrays, the error is computed from the (exact)
+    product in ``float64`` rather than in ``float32``.
+    """
+    val1 = np.asarray(val1)
+    val2 = np.asarray(val2)
+    product = val1 * val2
+    if use_fma and product.dtype == np.float32:
+        # NOTE: The product of two ``float32`` values is exact in
+        #       ``float64`` and so is its difference with ``product``.
+        exact = val1.astype(np.float64) * val2.astype(np.float64)
+        return product, (exact - product).astype(np.float32)
+
+    error = _dekker_error_array(val1, val2, product)
+    if not use_fma:
+        return product, error
+
+    # NOTE: An exact zero from ``fma(val1, val2, -product)`` is always
+    #       ``+0.0`` (in round-to-nearest) while Dekker's product can give
+    #       ``-0.0``; adding ``0.0`` fixes the sign and changes nothing
+    #       else.
+    error = error + 0.0
+
+    dekker_max, dekker_min = _dekker_bounds(product.dtype)
+    abs1 = np.abs(val1)
+    abs2 = np.abs(val2)
+    safe = (
+        (abs1 <= dekker_max)
+        & (abs2 <= dekker_max)
+        & ((np.abs(product) >= dekker_min) | (val1 == 0) | (val2 == 0))
+    )
+    unsafe = ~safe & np.isfinite(product)
+    if np.any(unsafe):
+        shape = np.shape(error)
+        error = np.array(error).reshape(-1)
+        flat1 = np.broadcast_to(val1, shape).reshape(-1)
+        flat2 = np.broadcast_to(val2, shape).reshape(-1)
+        flat_product = np.broadcast_to(product, shape).reshape(-1)
+        for index in np.flatnonzero(unsafe):
+            error[index] = _fma(
+                flat1[index], flat2[index], -flat_product[index]
+            )
+        error = error.reshape(shape)
+
+    return product, error
+
+
+def dot2(x, y):
+    """Compute a dot product as if in twice the working precision.
+
+    See: https://doi.org/10.1137/030601818 (``Dot2``).
+    """
+    if len(x) == 0:
+        return 0.0
+
+    p, s = multiply_eft(x[0], y[0])
+    for x_val, y_val in zip(x[1:], y[1:]):
+        h, r = multiply_eft(x_val, y_val)
+        p, q = add_eft(p, h)
+        s += q + r
+
+    return p + s
+
+
+def dot_k(x, y, k):
+    """Compute a dot product as if in ``k``-fold working precision.
+
+    See: https://doi.org/10.1137/030601818 (``DotK``). This transforms
+    the dot product into a sum of ``2n`` terms (error-free) and then
+    uses :func:`sum_k` with ``k - 1`` levels. Assumes ``k >= 2``.
+    """
+    n = len(x)
+    if n == 0:
+        return 0.0
+
+    r = [None] * (2 * n)
+    p, r[0] = multiply_eft(x[0], y[0])
+    for i in range(1, n):
+        h, r[i] = multiply_eft(x[i], y[i])
+        p, r[n + i - 1] = add_eft(p, h)
+    r[2 * n - 1] = p
+
+    return sum_k(r, k - 1)
+
+
+def divide_eft_array(val1, val2, use_fma=True):
+    """Vectorized version of :func:`divide_eft`."""
+    val1 = np.asarray(val1)
+    quotient = val1 / val2
+    product, error = multiply_eft_array(quotient, val2, use_fma=use_fma)
+    remainder = (val1 - product) - error
+    return quotient, remainder
+
+
+def sqrt_eft_array(val, use_fma=True):
+    """Vectorized version of :func:`sqrt_eft`."""
+    val = np.asarray(val)
+    root = np.sqrt(val)
+    product, error = multiply_eft_array(root, root, use_fma=use_fma)
+    remainder = (val - product) - error
+    return root, remainder
+
+
+def _as_complex_array(real, imag):
+    # Helper for the complex EFTs; unlike ``real + 1j * imag`` this
+    # doesn't turn ``(inf, 0)`` into ``(inf, nan)``.
+    result = np.empty(np.shape(real), dtype=np.complex128)
+    result.real = real
+    result.imag = imag
+    return result
+
+
+def add_eft_complex_array(val1, val2):
+    """Vectorized version of :func:`add_eft_complex`."""
+    val1 = np.asarray(val1, dtype=np.complex128)
+    val2 = np.asarray(val2, dtype=np.complex128)
+    real, real_err = add_eft_array(val1.real, val2.real)
+    imag, imag_err = add_eft_array(val1.imag, val2.imag)
+    sum_ = _as_complex_array(real, imag)
+    return sum_, _as_complex_array(real_err, imag_err)
+
+
+def multiply_eft_complex_array(val1, val2, use_fma=True):
+    """Vectorized version of :func:`multiply_eft_complex`."""
+    val1 = np.asarray(val1, dtype=np.complex128)
+    val2 = np.asarray(val2, dtype=np.complex128)
+    z1, h1 = multiply_eft_array(val1.real, val2.real, use_fma=use_fma)
+    z2, h2 = multiply_eft_array(val1.imag, val2.imag, use_fma=use_fma)
+    z3, h3 = multiply_eft_array(val1.real, val2.imag, use_fma=use_fma)
+    z4, h4 = multiply_eft_array(val1.imag, val2.real, use_fma=use_fma)
+    z5, h5 = add_eft_array(z1, -z2)
+    z6, h6 = add_eft_array(z3, z4)
+    return (
+        _as_complex_array(z5, z6),
+        _as_complex_array(h1, h3),
+        _as_complex_array(-h2, h4),
+        _as_complex_array(h5, h6),
+    )
+
+
+def _vec_sum_array(p):
+    # Helper for ``sum_k_array``.
+    # NOTE: This modifies ``p`` in place.
+    n = len(p)
+    for i in range(1, n):
+        p[i], p[i - 1] = add_eft_array(p[i], p[i - 1])
+
+
+def sum_k_array(p, k):
+    """Vectorized version of :func:`sum_k`.
+
+    The terms to be summed are indexed along the first axis of ``p`` and
+    the sums are computed independently (and simultaneously) for every
+    entry in the remaining axes. For example, if ``p`` has shape
+    ``(n, m)`` then the result has shape ``(m,)`` and entry ``i`` agrees
+    bit for bit with ``sum_k(p[:, i], k)``.
+    """
+    p = np.array(p)  # Make a copy to be modified.
+    if p.dtype.kind != "f":
+        p = p.astype(float)
+
+    for _ in range(k - 1):
+        _vec_sum_array(p)
+
+    result = p[0]
+    for p_val in p[1:]:
+        result = result + p_val
+
+    return result
+
+
+def _distill_array(values):
+    """Error-free pairwise reduction of a 1D array.
+
+    Returns ``(total, errors)`` such that the exact sum of ``values``
+    is equal to ``total + sum(errors)`` (barring overflow). This pairs
+    the first half of ``values`` with the second half so that each step
+    is a single vectorized :func:`add_eft_array`.
+    """
+    errors = []
+    while len(values) > 1:
+        half = len(values) // 2
+        sums, errs = add_eft_array(values[:half], values[half : 2 * half])
+        errors.append(errs)
+        if len(values) % 2 == 1:
+            sums = np.append(sums, values[-1])
+        values = sums
+
+    if len(values) == 0:
+        total = 0.0
+    else:
+        total = float(values[0])
+
+    if errors:
+        return total, np.concatenate(errors)
+    return total, np.empty((0,))
+
+
+class KSumAccumulator(object):
+    r"""Streaming version of :func:`sum_k`.
+
+    Values are added in chunks (e.g. slices of a memory-mapped file
+    or items from a generator) and only :math:`k` partial sums are
+    stored between chunks. Partial sum :math:`F` (for
+    :math:`0 \leq F < k - 1`) holds an error-free running total of the
+    errors from level :math:`F - 1` (with level :math:`0` being the input
+    values) and the last partial sum is a plain running total. Each
+    chunk is pushed through the levels with :func:`_distill_array`, so
+    the cost is :math:`k` vectorized passes over the chunk.
+
+    As in :func:`sum_k`, only the last level is rounded; the errors
+    carried into level :math:`F` are bounded by roughly
+    :math:`\left(\lceil \log_2 n \rceil \mathbf{u}\right)^F
+    \sum \left|p_j\right|` where :math:`n` is the largest chunk size,
+    so :meth:`result` is as accurate as if computed in :math:`k`-fold
+    working precision and then rounded.
+
+    Args:
+        k (int): The number of levels, as in :func:`sum_k`.
+
+    Raises:
+        ValueError: If ``k`` is not positive.
+    """
+
+    def __init__(self, k):
+        if k < 1:
+            raise ValueError("k must be positive", k)
+        self.k = k
+        self.partials = [0.0] * k
+
+    def add(self, chunk):
+        """Add a chunk of values to the running sum.
+
+        Args:
+            chunk (Union[numpy.ndarray, Iterable[float]]): The values to
+                add.
+        """
+        if isinstance(chunk, np.ndarray):
+            values = chunk.astype(float, copy=False).reshape(-1)
+        else:
+            values = np.fromiter(chunk, dtype=float)
+
+        for level in range(self.k - 1):
+            total, errors = _distill_array(values)
+            self.partials[level], error = add_eft(self.partials[level], total)
+            values = np.append(errors, error)
+
+        self.partials[self.k - 1] += float(np.sum(values))
+
+    def extend(self, chunks):
+        """Add each chunk from an iterable of chunks."""
+        for chunk in chunks:
+            self.add(chunk)
+
+    def merge(self, other):
+        """Add the running sum of another accumulator to this one.
+
+        Since the partial sums of ``other`` (exactly) sum to its running
+        total, they can just be added as a chunk.
+        """
+        self.add(other.partials)
+
+    def result(self):
+        """Get the :math:`k`-fold accurate sum of all values so far."""
+        return sum_k(self.partials, self.k)
+
+
+def _sum_k_worker(args):
+    # Helper for ``sum_k_parallel``.
+    # NOTE: This must be defined at module scope so it can be pickled.
+    values, k, chunk_size = args
+    accumulator = KSumAccumulator(k)
+    for start in range(0, len(values), chunk_size):
+        accumulator.add(values[start : start + chunk_size])
+    return accumulator.partials
+
+
+def sum_k_parallel(values, k, processes=None, chunk_size=2 ** 20):
+    """Compute :func:`sum_k` of a large array with a process pool.
+
+    The input is split into one contiguous block per process. Each
+    worker streams its block through a :class:`KSumAccumulator` and
+    returns the partial sums: a leading sum and a residual vector of
+    ``k - 1`` error terms, with only the last residual rounded. The
+    parent then merges the partial sums with another
+    :class:`KSumAccumulator`, so the result satisfies the same error
+    bound as a single :class:`KSumAccumulator` over the whole input.
+
+    Args:
+        values (numpy.ndarray): The values to sum.
+        k (int): The number of levels, as in :func:`sum_k`.
+        processes (Optional[int]): The number of worker processes.
+            Defaults to the number of CPUs.
+        chunk_size (Optional[int]): The number of values each worker
+            passes to :meth:`KSumAccumulator.add` at once; this bounds
+            the temporary memory used by each worker.
+
+    Returns:
+        float: The :math:`k`-fold accurate sum.
+    """
+    values = np.asarray(values, dtype=float).reshape(-1)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    blocks = np.array_split(values, processes)
+    tasks = [(block, k, chunk_size) for block in blocks]
+    if processes == 1:
+        results = [_sum_k_worker(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_sum_k_worker, tasks)
+
+    accumulator = KSumAccumulator(k)
+    for partials in results:
+        accumulator.add(partials)
+
+    return accumulator.result()
+
+
+def _zero_dot_array(x, y):
+    # Helper for ``dot2_array`` and ``dot_k_array``; the (zero) result of
+    # a dot product with no terms, with the shape of the remaining axes.
+    shape = np.broadcast(np.empty(x.shape[1:]), np.empty(y.shape[1:])).shape
+    return np.zeros(shape, dtype=np.result_type(x, y, 0.0))[()]
+
+
+def dot2_array(x, y):
+    """Vectorized version of :func:`dot2`.
+
+    As in :func:`sum_k_array`, the terms are indexed along the first
+    axis of ``x`` and ``y`` and the dot products are computed
+    independently for every entry in the remaining axes. For example, a
+    batch of evaluations with a basis matrix ``B`` of shape ``(m, n)``
+    is ``dot2_array(B.T, coeffs[:, np.newaxis])``.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) == 0:
+        return _zero_dot_array(x, y)
+
+    p, s = multiply_eft_array(x[0], y[0])
+    for x_val, y_val in zip(x[1:], y[1:]):
+        h, r = multiply_eft_array(x_val, y_val)
+        p, q = add_eft_array(p, h)
+        s = s + (q + r)
+
+    return p + s
+
+
+def dot_k_array(x, y, k):
+    """Vectorized version of :func:`dot_k`.
+
+    Uses the same layout as :func:`dot2_array`.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n == 0:
+        return _zero_dot_array(x, y)
+
+    r = [None] * (2 * n)
+    p, r[0] = multiply_eft_array(x[0], y[0])
+    for i in range(1, n):
+        h, r[i] = multiply_eft_array(x[i], y[i])
+        p, r[n + i - 1] = add_eft_array(p, h)
+    r[2 * n - 1] = p
+
+    return sum_k_array(np.broadcast_arrays(*r), k - 1)
+
+
+class Dyadic(object):
+    r"""An exact dyadic rational :math:`m \cdot 2^e`.
+
+    Every (finite) ``float`` is dyadic and dyadic rationals are closed
+    under addition, subtraction and multiplication, so these can be used
+    to compute exact references without the ``gcd`` normalization done
+    by ``fractions.Fraction``. The mantissa is kept odd (or zero) so
+    that equal values have equal representations.
+
+    Args:
+        mantissa (int): The integer mantissa :math:`m`.
+        exponent (Optional[int]): The power of two :math:`e`.
+    """
+
+    __slots__ = ("mantissa", "exponent")
+
+    def __init__(self, mantissa, exponent=0):
+        if mantissa == 0:
+            exponent = 0
+        else:
+            shift = (mantissa & -mantissa).bit_length() - 1
+            mantissa >>= shift
+            exponent += shift
+
+        self.mantissa = mantissa
+        self.exponent = exponent
+
+    @classmethod
+    def from_float(cls, value):
+        """Convert a ``float`` (exactly) to a dyadic rational."""
+        numer, denom = value.as_integer_ratio()
+        return cls(numer, 1 - denom.bit_length())
+
+    def __repr__(self):
+        return "Dyadic({}, {})".format(self.mantissa, self.exponent)
+
+    def __float__(self):
+        # NOTE: Integer true division is correctly rounded.
+        if self.exponent >= 0:
+            return float(self.mantissa << self.exponent)
+        return self.mantissa / (1 << -self.exponent)
+
+    def __eq__(self, other):
+        if not isinstance(other, (Dyadic, int, float)):
+            return NotImplemented
+        if isinstance(other, float) and not math.isfinite(other):
+            return False
+
+        other = _as_dyadic(other)
+        return (
+            self.mantissa == other.mantissa and self.exponent == other.exponent
+        )
+
+    def __hash__(self):
+        return hash((self.mantissa, self.exponent))
+
+    def __neg__(self):
+        return Dyadic(-self.mantissa, self.exponent)
+
+    def __abs__(self):
+        return Dyadic(abs(self.mantissa), self.exponent)
+
+    def __add__(self, other):
+        other = _as_dyadic(other)
+        exponent = min(self.exponent, other.exponent)
+        mantissa = (self.mantissa << (self.exponent - exponent)) + (
+            other.mantissa << (other.exponent - exponent)
+        )
+        return Dyadic(mantissa, exponent)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self + (-_as_dyadic(other))
+
+    def __rsub__(self, other):
+        return _as_dyadic(other) + (-self)
+
+    def __mul__(self, other):
+        other = _as_dyadic(other)
+        return Dyadic(
+            self.mantissa * other.mantissa, self.exponent + other.exponent
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """Divide by a power of two.
+
+        Raises:
+            ValueError: If ``other`` is not a power of two (since the
+                quotient would not be dyadic).
+        """
+        other = _as_dyadic(other)
+        if abs(other.mantissa) != 1:
+            raise ValueError("Only division by a power of two is exact")
+        return Dyadic(
+            self.mantissa * other.mantissa, self.exponent - other.exponent
+        )
+
+    def __pow__(self, power):
+        """Raise to a non-negative integer power.
+
+        Raises:
+            ValueError: If ``power`` is negative (since the result would
+                not be dyadic).
+        """
+        if power < 0:
+            raise ValueError("Only non-negative powers are exact", power)
+        return Dyadic(self.mantissa ** power, self.exponent * power)
+
+
+def _as_dyadic(value):
+    # Helper for ``Dyadic``.
+    if isinstance(value, Dyadic):
+        return value
+    if isinstance(value, int):
+        return Dyadic(value)
+    return Dyadic.from_float(value)
+
+
+def dyadic_ratio(numerator, denominator):
+    """Compute the correctly rounded ratio of two dyadic rationals.
+
+    Args:
+        numerator (Union[Dyadic, float, int]): The numerator.
+        denominator (Union[Dyadic, float, int]): The (non-zero)
+            denominator.
+
+    Returns:
+        float: The ratio, correctly rounded.
+    """
+    numerator = _as_dyadic(numerator)
+    denominator = _as_dyadic(denominator)
+    shift = numerator.exponent - denominator.exponent
+    if shift >= 0:
+        return (numerator.mantissa << shift) / denominator.mantissa
+    return numerator.mantissa / (denominator.mantissa << -shift)
+
+
+def relative_error(approx, exact):
+    r"""Compute the correctly rounded relative error of an approximation.
+
+    Args:
+        approx (Union[Dyadic, float]): The computed value.
+        exact (Union[Dyadic, float]): The (non-zero) exact value.
+
+    Returns:
+        float: :math:`|\widehat{p} - p| / |p|`, correctly rounded.
+    """
+    exact = _as_dyadic(exact)
+    return dyadic_ratio(abs(_as_dyadic(approx) - exact), abs(exact))
+
+
+def _multi_args(points, coeffs):
+    # Helper for ``basic_multi`` and ``compensated_multi`` in both
+    # ``horner`` and ``de_casteljau``.
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    if coeffs.ndim != 2:
+        raise ValueError("Expected a 2D array of coefficients", coeffs.shape)
+
+    num_polys, _ = coeffs.shape
+    points = np.asarray(points, dtype=np.float64)
+    if points.shape not in ((), (num_polys,)):
+        raise ValueError(
+            "Expected a single point or one point per polynomial",
+            points.shape,
+            num_polys,
+        )
+
+    points = np.broadcast_to(points, (num_polys,)).copy()
+    # NOTE: Each "coefficient" is a column, i.e. the coefficient of a
+    #       given basis function for every polynomial.
+    return points, tuple(coeffs.T)
+
+
+def exact_bernstein(s, coeffs):
+    r"""Evaluate a polynomial in Bernstein form exactly.
+
+    This uses the same ordering of ``coeffs`` as :mod:`de_casteljau` and
+    computes :math:`\sum_j \binom{n}{j} b_j (1 - s)^{n - j} s^j`
+    directly from the powers of :math:`s` and :math:`1 - s`.
+
+    Args:
+        s (Union[Dyadic, float]): The point to evaluate at.
+        coeffs (Sequence[float]): The Bernstein coefficients.
+
+    Returns:
+        Dyadic: The exact value.
+    """
+    s = _as_dyadic(s)
+    r = 1 - s
+    degree = len(coeffs) - 1
+
+    s_powers = [Dyadic(1)]
+    r_powers = [Dyadic(1)]
+    for _ in range(degree):
+        s_powers.append(s_powers[-1] * s)
+        r_powers.append(r_powers[-1] * r)
+
+    result = Dyadic(0)
+    binomial = 1
+    for j, coeff in enumerate(coeffs):
+        term = _as_dyadic(coeff) * r_powers[degree - j] * s_powers[j]
+        result += binomial * term
+        binomial = binomial * (degree - j) // (j + 1)
+
+    return result
+
+
+def exact_monomial(x, coeffs):
+    """Evaluate a polynomial in monomial form exactly.
+
+    This uses the same ordering of ``coeffs`` as :mod:`horner`.
+
+    Args:
+        x (Union[Dyadic, float]): The point to evaluate at.
+        coeffs (Sequence[float]): The monomial coefficients.
+
+    Returns:
+        Dyadic: The exact value.
+    """
+    x = _as_dyadic(x)
+    p = Dyadic(0)
+    for coeff in coeffs:
+        p = p * x + _as_dyadic(coeff)
+
+    return p
+
+
+def _next_power_two(value):
+    # Helper for ``_acc_sum``: smallest power of two at least ``|value|``.
+    frac, exponent = math.frexp(abs(value))
+    if frac == 0.5:
+        return abs(value)
+    return math.ldexp(1.0, exponent)
+
+
+def _extract_vector(sigma, p):
+    # Helper for ``acc_sum``.
+    # NOTE: This modifies ``p`` in place.
+    tau = 0.0
+    for i, p_val in enumerate(p):
+        q = (sigma + p_val) - sigma
+        p[i] = p_val - q
+        tau += q
+    return tau
+
+
+def _extract_vector_array(sigma, p):
+    # Helper for ``acc_sum_array``.
+    # NOTE: This modifies ``p`` in place. The sum of the ``q`` is exact
+    #       in any order, so ``np.sum`` can be used.
+    q = (sigma + p) - sigma
+    p -= q
+    return float(np.sum(q))
+
+
+def _exact_sum(p):
+    # Helper for ``_acc_sum``; the correctly rounded sum, via ``Dyadic``.
+    total = Dyadic(0)
+    for p_val in p:
+        total = total + Dyadic.from_float(float(p_val))
+    try:
+        return float(total)
+    except OverflowError:
+        return math.inf if total.mantissa > 0 else -math.inf
+
+
+def _acc_sum(p, extract_vector, max_abs, plain_sum, scale_values):
+    """Perform ``AccSum`` for :func:`acc_sum` and :func:`acc_sum_array`.
+
+    .. _ROO08: https://doi.org/10.1137/050645671
+
+    See Algorithm 4.5 in `ROO08`_. In each pass, the high order parts
+    of the ``p_i`` (relative to ``sigma``) are extracted and summed
+    exactly. This stops as soon as the running total is large enough
+    relative to ``sigma`` for the result to be faithfully rounded, so
+    well-conditioned sums only need one or two passes.
+
+    .. note::
+
+       The stopping condition uses ``2^{2M + 1} eps`` rather than
+       ``2^{2M} eps``, i.e. it is conservative by a factor of two.
+
+    ``scale_values(p, factor)`` must return the values multiplied by a
+    power of two ``factor`` and an indicator of whether that was exact.
+    It is used when ``sigma`` would overflow: the values are scaled down
+    and the result is scaled back up. If the scaling isn't exact (i.e.
+    some tiny values would lose bits), the sum is computed exactly with
+    :class:`Dyadic` instead.
+    """
+    eps = 2.0 ** -53
+    two_m = _next_power_two(len(p) + 2)
+    # NOTE: ``sigma = 2^M * 2^{ceil(log2(mu))}`` must not overflow.
+    if max_abs(p) >= 2.0 ** 1022 / two_m:
+        exponent = math.frexp(two_m)[1] + 1
+        scaled, exact = scale_values(p, 2.0 ** -exponent)
+        if not exact:
+            return _exact_sum(p)
+        result = _acc_sum(scaled, extract_vector, max_abs, plain_sum, None)
+        # NOTE: Multiplying (rather than ``math.ldexp``) gives ``inf`` if
+        #       the sum really does overflow.
+        return result * 2.0 ** exponent
+
+    phi = two_m * eps
+    factor = 2.0 * two_m * two_m * eps
+
+    while True:
+        mu = max_abs(p)
+        if mu == 0.0:
+            return 0.0
+
+        sigma = two_m * _next_power_two(mu)
+        t = 0.0
+        while True:
+            tau = extract_vector(sigma, p)
+            t_new = t + tau
+            if abs(t_new) >= factor * sigma or sigma <= sys.float_info.min:
+                tau2 = tau - (t_new - t)
+                return t_new + (tau2 + plain_sum(p))
+
+            t = t_new
+            if t == 0.0:
+                # NOTE: Everything extracted so far has cancelled, so
+                #       start over with what remains in ``p``.
+                break
+            sigma = phi * sigma
+
+
+def acc_sum(p):
+    """Compute a faithfully rounded sum with early termination.
+
+    Unlike :func:`sum_k`, the number of passes over the data adapts to
+    the condition of the sum: it is close to one pass for well
+    conditioned sums, while the result is always faithfully rounded
+    (i.e. one of the two floats adjacent to the exact sum).
+    """
+    p = [float(p_val) for p_val in p]  # Make a copy to be modified.
+
+    def scale_values(p, factor):
+        scaled = [p_val * factor for p_val in p]
+        exact = all(
+            p_val / factor == value for p_val, value in zip(scaled, p)
+        )
+        return scaled, exact
+
+    return _acc_sum(
+        p,
+        _extract_vector,
+        lambda p: max(map(abs, p), default=0.0),
+        sum,
+        scale_values,
+    )
+
+
+def acc_sum_array(p):
+    """Vectorized version of :func:`acc_sum`.
+
+    Unlike the other ``*_array`` functions, this sums a 1D array into a
+    single value; each extraction pass is a vectorized operation.
+    """
+    p = np.array(p, dtype=float).reshape(-1)  # Make a copy to be modified.
+
+    def max_abs(p):
+        if p.size == 0:
+            return 0.0
+        return float(np.max(np.abs(p)))
+
+    def scale_values(p, factor):
+        scaled = p * factor
+        return scaled, bool(np.all(scaled / factor == p))
+
+    return _acc_sum(
+        p,
+        _extract_vector_array,
+        max_abs,
+        lambda p: float(np.sum(p)),
+        scale_values,
+    )
+
+
+set_fma_backend()
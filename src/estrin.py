@@ -0,0 +1,227 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Performs Estrin's scheme.
+
+Estrin's scheme computes
+
+.. math::
+
+    p(x) = a_n x^n + \cdots a_1 x + a_0
+
+by pairing up neighboring terms:
+
+.. math::
+
+    \begin{align*}
+    q_j^{(0)} &= a_j \\
+    q_j^{(k + 1)} &= q_{2j}^{(k)} + q_{2j + 1}^{(k)} x^{2^k}
+    \end{align*}
+
+until a single :math:`q_0^{(\lceil \log_2 (n + 1) \rceil)} = p(x)` remains
+(a term without a partner is carried to the next level as-is). Unlike
+Horner's method, each level is a set of independent updates, so the
+dependency chain has length :math:`O(\log n)` rather than :math:`O(n)`.
+
+This module provides both the standard version and a compensated version,
+in which every sum and product is replaced by an error-free
+transformation and the (first order) errors are propagated alongside the
+values, exactly as in the compensated Horner's method.
+
+.. note::
+
+   To match :mod:`horner`, this assumes throughout that ``coeffs`` is
+   ordered from :math:`a_n` to :math:`a_0`.
+"""
+
+import numpy as np
+
+import eft
+
+# NOTE: The vectorized functions hold every coefficient at every point,
+#       so the points are processed in blocks to keep this working set
+#       small enough to stay in cache.
+_BLOCK_SIZE = 1024
+
+
+def basic(x, coeffs):
+    if not coeffs:
+        return 0.0
+
+    values = list(reversed(coeffs))
+    power = x
+    while len(values) > 1:
+        num_values = len(values)
+        new_values = []
+        for j in range(0, num_values - 1, 2):
+            new_values.append(values[j] + values[j + 1] * power)
+        if num_values % 2 == 1:
+            new_values.append(values[-1])
+
+        # Update the "current" values.
+        values = new_values
+        if len(values) > 1:
+            power = power * power
+
+    return values[0]
+
+
+def _compensated(x, coeffs):
+    # Helper for ``compensated``; returns ``p`` and its error ``e``.
+    if not coeffs:
+        return 0.0, 0.0
+
+    values = list(reversed(coeffs))
+    errors = [0.0] * len(values)
+    power = x
+    power_err = 0.0
+    while len(values) > 1:
+        num_values = len(values)
+        new_values = []
+        new_errors = []
+        for j in range(0, num_values - 1, 2):
+            prod, pi = eft.multiply_eft(values[j + 1], power)
+            value, sigma = eft.add_eft(values[j], prod)
+            new_values.append(value)
+            new_errors.append(
+                errors[j]
+                + (power * errors[j + 1] + values[j + 1] * power_err)
+                + (pi + sigma)
+            )
+        if num_values % 2 == 1:
+            new_values.append(values[-1])
+            new_errors.append(errors[-1])
+
+        # Update the "current" values.
+        values = new_values
+        errors = new_errors
+        if len(values) > 1:
+            new_power, pi = eft.multiply_eft(power, power)
+            power_err = 2.0 * power * power_err + pi
+            power = new_power
+
+    return values[0], errors[0]
+
+
+def compensated(x, coeffs):
+    p, e = _compensated(x, coeffs)
+    return p + e
+
+
+def _blocked(kernel, x, coeffs):
+    # Helper for ``basic_array`` and ``compensated_array``.
+    x = np.asarray(x, dtype=np.float64)
+    if not coeffs:
+        return np.zeros_like(x)
+
+    flat_x = x.ravel()
+    result = np.empty_like(flat_x)
+    for start in range(0, flat_x.size, _BLOCK_SIZE):
+        stop = start + _BLOCK_SIZE
+        result[start:stop] = kernel(flat_x[start:stop], coeffs)
+
+    return result.reshape(x.shape)
+
+
+def _stack_coeffs(x, coeffs):
+    # Helper for ``basic_array`` and ``compensated_array``; puts the
+    # coefficients (in increasing degree) along the first axis.
+    values = np.empty((len(coeffs),) + x.shape, dtype=x.dtype)
+    for j, coeff in enumerate(reversed(coeffs)):
+        values[j] = coeff
+    return values
+
+
+def basic_array(x, coeffs):
+    """Perform Estrin's scheme at an array of points.
+
+    Each level of the scheme is a single vectorized update of all pairs
+    (at every point in a block of points).
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`basic`.
+    """
+    return _blocked(_basic_block, x, coeffs)
+
+
+def _basic_block(x, coeffs):
+    # Helper for ``basic_array``; ``x`` is a 1D block of points.
+    values = _stack_coeffs(x, coeffs)
+    power = x
+    while values.shape[0] > 1:
+        num_pairs, remainder = divmod(values.shape[0], 2)
+        new_values = (
+            values[0 : 2 * num_pairs : 2]
+            + values[1 : 2 * num_pairs : 2] * power
+        )
+        if remainder == 1:
+            new_values = np.concatenate([new_values, values[-1:]])
+
+        # Update the "current" values.
+        values = new_values
+        if values.shape[0] > 1:
+            power = power * power
+
+    return values[0]
+
+
+def compensated_array(x, coeffs):
+    """Perform compensated Estrin's scheme at an array of points.
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`compensated`.
+    """
+    return _blocked(_compensated_block, x, coeffs)
+
+
+def _compensated_block(x, coeffs):
+    # Helper for ``compensated_array``; ``x`` is a 1D block of points.
+    values = _stack_coeffs(x, coeffs)
+    errors = np.zeros_like(values)
+    power = x
+    power_err = np.zeros_like(x)
+    while values.shape[0] > 1:
+        num_pairs, remainder = divmod(values.shape[0], 2)
+        evens = values[0 : 2 * num_pairs : 2]
+        odds = values[1 : 2 * num_pairs : 2]
+        prod, pi = eft.multiply_eft_array(odds, power)
+        new_values, sigma = eft.add_eft_array(evens, prod)
+        new_errors = (
+            errors[0 : 2 * num_pairs : 2]
+            + (power * errors[1 : 2 * num_pairs : 2] + odds * power_err)
+            + (pi + sigma)
+        )
+        if remainder == 1:
+            new_values = np.concatenate([new_values, values[-1:]])
+            new_errors = np.concatenate([new_errors, errors[-1:]])
+
+        # Update the "current" values.
+        values = new_values
+        errors = new_errors
+        if values.shape[0] > 1:
+            new_power, pi = eft.multiply_eft_array(power, power)
+            power_err = 2.0 * power * power_err + pi
+            power = new_power
+
+    return values[0] + errors[0]
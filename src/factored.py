@@ -0,0 +1,258 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Polynomials in factored form.
+
+A polynomial
+
+.. math::
+
+    p(x) = c \prod_i \left(x - r_i\right)^{m_i}
+
+can be evaluated with :math:`n = \sum_i m_i` multiplications rather than
+by expanding it and using :mod:`horner` or :mod:`de_casteljau`. Each
+difference :math:`x - r_i` is computed with :func:`eft.add_eft` and the
+product with :func:`eft.multiply_eft` (this is the compensated product
+of Graillat), so the computed value is as accurate as if computed in
+twice the working precision, for **any** :math:`x`: unlike the expanded
+forms, there is no condition number to amplify the rounding errors.
+"""
+
+import fractions
+
+import numpy as np
+
+import eft
+
+
+class FactoredPolynomial(object):
+    r"""A polynomial :math:`c \prod_i \left(x - r_i\right)^{m_i}`.
+
+    Args:
+        roots (Sequence[float]): The distinct roots :math:`r_i`.
+        multiplicities (Optional[Sequence[int]]): The multiplicity of
+            each root. Defaults to all ones.
+        leading (Optional[float]): The leading coefficient :math:`c`.
+            Defaults to 1.
+
+    Raises:
+        ValueError: If the number of ``multiplicities`` does not match
+            the number of ``roots``.
+        ValueError: If any multiplicity is not a positive integer.
+    """
+
+    __slots__ = ("roots", "multiplicities", "leading")
+
+    def __init__(self, roots, multiplicities=None, leading=1.0):
+        roots = tuple(float(root) for root in roots)
+        if multiplicities is None:
+            multiplicities = (1,) * len(roots)
+        multiplicities = tuple(multiplicities)
+        if len(multiplicities) != len(roots):
+            raise ValueError(
+                "Expected one multiplicity per root",
+                len(roots),
+                len(multiplicities),
+            )
+        for multiplicity in multiplicities:
+            if int(multiplicity) != multiplicity or multiplicity < 1:
+                raise ValueError(
+                    "Expected a positive integer multiplicity", multiplicity
+                )
+
+        self.roots = roots
+        self.multiplicities = tuple(int(value) for value in multiplicities)
+        self.leading = float(leading)
+
+    def __repr__(self):
+        return "FactoredPolynomial({!r}, {!r}, {!r})".format(
+            self.roots, self.multiplicities, self.leading
+        )
+
+    @property
+    def degree(self):
+        """int: The degree of the polynomial."""
+        return sum(self.multiplicities)
+
+    def basic(self, x):
+        """Evaluate the product directly."""
+        p = self.leading
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            diff = x - root
+            for _ in range(multiplicity):
+                p = p * diff
+
+        return p
+
+    def _compensated(self, x):
+        # Helper for ``compensated``; returns ``p`` and its error ``e``.
+        p = self.leading
+        e = 0.0
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            diff, delta = eft.add_eft(x, -root)
+            for _ in range(multiplicity):
+                p_times_delta = p * delta
+                p, pi = eft.multiply_eft(p, diff)
+                e = e * diff + (p_times_delta + pi)
+
+        return p, e
+
+    def compensated(self, x):
+        r"""Evaluate the product with error-free transformations.
+
+        With :math:`x - r_i = d_i + \delta_i` exactly, each update of
+        the running product :math:`\widehat{p} + \widehat{e}` is
+
+        .. math::
+
+            \widehat{p} d_i = P + \pi, \quad \widehat{e} \leftarrow
+                \widehat{e} \otimes d_i \oplus \left(\widehat{p}
+                \otimes \delta_i \oplus \pi\right)
+
+        i.e. everything except the (second order) :math:`\widehat{e}
+        \delta_i` term is accounted for.
+        """
+        p, e = self._compensated(x)
+        return p + e
+
+    def basic_array(self, x):
+        """Vectorized version of :meth:`basic`.
+
+        Args:
+            x (numpy.ndarray): The points to evaluate at.
+
+        Returns:
+            numpy.ndarray: The values, with the same shape as ``x``. Each
+            value is identical to the one computed by :meth:`basic`.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        p = np.full_like(x, self.leading)
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            diff = x - root
+            for _ in range(multiplicity):
+                p = p * diff
+
+        return p
+
+    def compensated_array(self, x):
+        """Vectorized version of :meth:`compensated`.
+
+        Args:
+            x (numpy.ndarray): The points to evaluate at.
+
+        Returns:
+            numpy.ndarray: The values, with the same shape as ``x``. Each
+            value is identical to the one computed by
+            :meth:`compensated`.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        p = np.full_like(x, self.leading)
+        e = np.zeros_like(x)
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            diff, delta = eft.add_eft_array(x, -root)
+            for _ in range(multiplicity):
+                p_times_delta = p * delta
+                p, pi = eft.multiply_eft_array(p, diff)
+                e = e * diff + (p_times_delta + pi)
+
+        return p + e
+
+    def exact(self, x):
+        """Evaluate the polynomial exactly.
+
+        Args:
+            x (Union[eft.Dyadic, float]): The point to evaluate at.
+
+        Returns:
+            eft.Dyadic: The exact value.
+        """
+        x = eft._as_dyadic(x)
+        p = eft._as_dyadic(self.leading)
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            p = p * (x - root) ** multiplicity
+
+        return p
+
+    def _monomial(self):
+        # Helper for ``to_monomial`` and ``to_bernstein``; the exact
+        # coefficients, **lowest** degree first.
+        F = fractions.Fraction
+        coeffs = [F(self.leading)]
+        for root, multiplicity in zip(self.roots, self.multiplicities):
+            root = F(root)
+            for _ in range(multiplicity):
+                # Multiply by ``(x - root)``.
+                shifted = [F(0)] + coeffs
+                for j, coeff in enumerate(coeffs):
+                    shifted[j] -= root * coeff
+                coeffs = shifted
+
+        return coeffs
+
+    def to_monomial(self, exact=False):
+        """Expand into the monomial basis.
+
+        The coefficients are computed exactly (every ``float`` is a
+        rational) and only rounded at the end.
+
+        Args:
+            exact (Optional[bool]): Indicates if the exact coefficients
+                should be returned rather than rounded to the nearest
+                ``float``. Defaults to :data:`False`.
+
+        Returns:
+            Tuple[Union[float, fractions.Fraction], ...]: The
+            coefficients, ordered from :math:`a_n` to :math:`a_0` as in
+            :mod:`horner`.
+        """
+        coeffs = self._monomial()
+        coeffs.reverse()
+        if exact:
+            return tuple(coeffs)
+        return tuple(float(coeff) for coeff in coeffs)
+
+    def to_bernstein(self, exact=False):
+        r"""Expand into the Bernstein basis on :math:`\left[0, 1\right]`.
+
+        Uses :math:`x^i = \sum_{j = i}^n \binom{j}{i} \binom{n}{i}^{-1}
+        B_{j, n}(x)` on the exact monomial coefficients. Unlike the
+        monomial coefficients, these need not be dyadic (e.g. they may
+        have a factor of 3 in the denominator), so rounding can't always
+        be avoided.
+
+        Args:
+            exact (Optional[bool]): Indicates if the exact coefficients
+                should be returned rather than rounded to the nearest
+                ``float``. Defaults to :data:`False`.
+
+        Returns:
+            Tuple[Union[float, fractions.Fraction], ...]: The
+            coefficients, ordered as in :mod:`de_casteljau`.
+        """
+        monomial = self._monomial()
+        degree = len(monomial) - 1
+        coeffs = []
+        for j in range(degree + 1):
+            value = fractions.Fraction(0)
+            binomial_j = 1  # C(j, i)
+            binomial_n = 1  # C(n, i)
+            for i in range(j + 1):
+                value += monomial[i] * fractions.Fraction(
+                    binomial_j, binomial_n
+                )
+                binomial_j = binomial_j * (j - i) // (i + 1)
+                binomial_n = binomial_n * (degree - i) // (i + 1)
+            coeffs.append(value)
+
+        if exact:
+            return tuple(coeffs)
+        return tuple(float(coeff) for coeff in coeffs)
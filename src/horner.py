@@ -33,18 +33,80 @@ This module provides both the standard version and a compensated version.
 .. note::
 
    This assumes throughout that ``coeffs`` is ordered from
-   :math:`a_n` to :math:`a_0`.
+   :math:`a_n` to :math:`a_0`. Any of the functions also accept a
+   :class:`HornerPolynomial`, which caches work shared by repeated
+   evaluations of the same polynomial.
 """
 
+import math
+
+import numpy as np
+
 import eft
 
 
+class HornerPolynomial(object):
+    """A polynomial prepared for repeated evaluation with Horner's method.
+
+    This is a read-only sequence of the coefficients (so it can be
+    passed anywhere a ``coeffs`` tuple is accepted), which also caches
+    the slices of the coefficients used in each Horner loop and the
+    degree.
+
+    Args:
+        coeffs (Sequence[float]): The coefficients, ordered from
+            :math:`a_n` to :math:`a_0`.
+    """
+
+    __slots__ = ("coeffs", "degree", "tail", "interior")
+
+    def __init__(self, coeffs):
+        self.coeffs = tuple(coeffs)
+        self.degree = len(self.coeffs) - 1
+        self.tail = self.coeffs[1:]
+        self.interior = self.coeffs[1:-1]
+
+    def __repr__(self):
+        return "HornerPolynomial({!r})".format(self.coeffs)
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    def __iter__(self):
+        return iter(self.coeffs)
+
+    def __getitem__(self, index):
+        return self.coeffs[index]
+
+
+def _as_polynomial(coeffs):
+    # Helper for the Newton routines, which evaluate the same
+    # polynomial many times.
+    if isinstance(coeffs, HornerPolynomial):
+        return coeffs
+    return HornerPolynomial(coeffs)
+
+
+def _tail(coeffs):
+    # Helper for the Horner loops; reuses the cached slice if possible.
+    if isinstance(coeffs, HornerPolynomial):
+        return coeffs.tail
+    return coeffs[1:]
+
+
+def _interior(coeffs):
+    # Helper for the ``HD`` loops; reuses the cached slice if possible.
+    if isinstance(coeffs, HornerPolynomial):
+        return coeffs.interior
+    return coeffs[1:-1]
+
+
 def basic(x, coeffs):
     if not coeffs:
         return 0.0
 
     p = coeffs[0]
-    for coeff in coeffs[1:]:
+    for coeff in _tail(coeffs):
         p = p * x + coeff
 
     return p
@@ -57,7 +119,7 @@ def _compensated(x, coeffs):
     p = coeffs[0]
     e_pi = []
     e_sigma = []
-    for coeff in coeffs[1:]:
+    for coeff in _tail(coeffs):
         prod, e1 = eft.multiply_eft(p, x)
         p, e2 = eft.add_eft(prod, coeff)
         e_pi.append(e1)
@@ -66,7 +128,8 @@ def _compensated(x, coeffs):
     return p, e_pi, e_sigma
 
 
-def compensated(x, coeffs):
+def _compensated_error(x, coeffs):
+    # Helper for ``compensated``; returns ``p`` and its error ``e``.
     p, e_pi, e_sigma = _compensated(x, coeffs)
 
     # Compute the error via standard Horner's.
@@ -74,9 +137,52 @@ def compensated(x, coeffs):
     for e1, e2 in zip(e_pi, e_sigma):
         e = x * e + (e1 + e2)
 
+    return p, e
+
+
+def compensated(x, coeffs):
+    p, e = _compensated_error(x, coeffs)
     return p + e
 
 
+def _basic_array(x, coeffs):
+    # Vectorized version of ``basic``; keeps the ``dtype`` of ``x``.
+    p = np.empty_like(x)
+    if not coeffs:
+        p[...] = 0.0
+        return p
+
+    p[...] = coeffs[0]
+    for coeff in _tail(coeffs):
+        p = p * x + coeff
+
+    return p
+
+
+def _compensated_array(x, coeffs):
+    """Vectorized version of :func:`compensated`.
+
+    Keeps the ``dtype`` of ``x`` (which should match ``coeffs``) and
+    performs the same operations as :func:`compensated`, but evaluates
+    the error polynomial in the same loop rather than storing the
+    intermediate errors. Returns the computed value and the computed
+    error, i.e. :func:`compensated` returns their sum.
+    """
+    p = np.empty_like(x)
+    e = np.zeros_like(x)
+    if not coeffs:
+        p[...] = 0.0
+        return p, e
+
+    p[...] = coeffs[0]
+    for coeff in _tail(coeffs):
+        prod, e1 = eft.multiply_eft_array(p, x)
+        p, e2 = eft.add_eft_array(prod, coeff)
+        e = x * e + (e1 + e2)
+
+    return p, e
+
+
 def compensated3(x, coeffs):
     h1, p2, p3 = _compensated(x, coeffs)
     h2, p4, p5 = _compensated(x, p2)
@@ -93,23 +199,291 @@ def compensated3(x, coeffs):
     return eft.sum_k(p, 3)
 
 
+def _error_sum_eft(errors):
+    # Helper for ``_compensated_k``; sums ``errors`` with an error-free
+    # transformation, so ``l_hat + sum(new_errors) == sum(errors)``.
+    # NOTE: This assumes, but does not check, that there are at least
+    #       two ``errors``.
+    num_errs = len(errors)
+    new_errors = [None] * (num_errs - 1)
+
+    l_hat, new_errors[0] = eft.add_eft(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, new_errors[j - 1] = eft.add_eft(l_hat, errors[j])
+
+    return new_errors, l_hat
+
+
+def _compensated_k(x, coeffs, K):
+    r"""Performs a K-compensated Horner's method.
+
+    .. _GLL09: https://doi.org/10.1137/070686299
+
+    Rather than building the binary tree of :math:`2^K - 1` error
+    polynomials used by :func:`compensated3` (and in `GLL09`_), this
+    carries a fixed stack of :math:`K` values, exactly as is done in
+    :func:`de_casteljau._compensated_k`. At level :math:`F`
+
+    .. math::
+
+        \widehat{b}_k^{(F)} = \widehat{\ell}_k^{(F)} \oplus \left(
+            \widehat{b}_{k + 1}^{(F)} \otimes x\right)
+
+    where :math:`\widehat{\ell}_k^{(F)}` is the (error-free) sum of the
+    errors from level :math:`F - 1`. Only the last level is computed
+    without error-free transformations. This uses :math:`O(K n)`
+    operations rather than :math:`O(2^K n)`.
+
+    This assumes, but does not check, that ``K`` is at least 2.
+
+    Returns:
+        Tuple[float, ...]: The ``K`` levels; their exact sum is the
+        compensated value of the polynomial.
+    """
+    if not coeffs:
+        return (0.0,) * K
+
+    bk = [coeffs[0]] + [0.0] * (K - 1)
+    for coeff in _tail(coeffs):
+        # Update the "level 0" stuff.
+        P, pi = eft.multiply_eft(bk[0], x)
+        S, sigma = eft.add_eft(P, coeff)
+        new_bk = [S]
+
+        errors = [pi, sigma]
+        for F in range(1, K - 2 + 1):
+            new_errors, l_hat = _error_sum_eft(errors)
+            P, pi = eft.multiply_eft(bk[F], x)
+            S, sigma = eft.add_eft(P, l_hat)
+            new_bk.append(S)
+
+            new_errors.extend([pi, sigma])
+            errors = new_errors
+
+        # Update the last level without error-free transformations.
+        l_hat = errors[0] + errors[1]
+        for error in errors[2:]:
+            l_hat += error
+        new_bk.append(x * bk[K - 1] + l_hat)
+
+        # Update the "current" values.
+        bk = new_bk
+
+    return tuple(bk)
+
+
 def compensated_k(x, coeffs, k):
-    h = {}
-    p = {1: coeffs}
+    """Performs a K-compensated Horner's method.
+
+    The levels computed by :func:`_compensated_k` are combined with
+    K-fold summation. When ``k = 2`` this agrees with
+    :func:`compensated`.
+    """
+    if k == 1:
+        return basic(x, coeffs)
+
+    return eft.sum_k(_compensated_k(x, coeffs, k), k)
+
+
+def _compensated_terms_array(x, coeffs):
+    # Vectorized version of ``_compensated``; ``coeffs`` may contain
+    # arrays (e.g. the error terms from a previous call).
+    p = np.empty_like(x)
+    if not coeffs:
+        p[...] = 0.0
+        return p, [], []
+
+    p[...] = coeffs[0]
+    e_pi = []
+    e_sigma = []
+    for coeff in _tail(coeffs):
+        prod, e1 = eft.multiply_eft_array(p, x)
+        p, e2 = eft.add_eft_array(prod, coeff)
+        e_pi.append(e1)
+        e_sigma.append(e2)
+
+    return p, e_pi, e_sigma
+
+
+def basic_array(x, coeffs):
+    """Perform Horner's method at an array of points.
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`basic`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    return _basic_array(x, coeffs)
+
+
+def compensated_array(x, coeffs):
+    """Perform compensated Horner's method at an array of points.
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`compensated`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    p, e = _compensated_array(x, coeffs)
+    return p + e
+
 
-    # First, "filter" off the errors from the interior
-    # polynomials.
-    for i in range(1, 2 ** (k - 1)):
-        h[i], p[2 * i], p[2 * i + 1] = _compensated(x, p[i])
+def compensated3_array(x, coeffs):
+    """Vectorized version of :func:`compensated3`.
 
-    # Then use standard Horner for the leaf polynomials.
-    for i in range(2 ** (k - 1), 2 ** k):
-        h[i] = basic(x, p[i])
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
 
-    # Now use K-fold summation on everything in ``h`` (but keep the
-    # order).
-    to_sum = [h[i] for i in range(1, 2 ** k)]
-    return eft.sum_k(to_sum, k)
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`compensated3`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    h1, p2, p3 = _compensated_terms_array(x, coeffs)
+    h2, p4, p5 = _compensated_terms_array(x, p2)
+    h3, p6, p7 = _compensated_terms_array(x, p3)
+
+    # Use standard Horner from here.
+    h4 = _basic_array(x, p4)
+    h5 = _basic_array(x, p5)
+    h6 = _basic_array(x, p6)
+    h7 = _basic_array(x, p7)
+
+    # Now use 3-fold summation.
+    p = np.stack([h1, h2, h3, h4, h5, h6, h7])
+    return eft.sum_k_array(p, 3)
+
+
+def _error_sum_eft_array(errors):
+    # Vectorized version of ``_error_sum_eft``.
+    num_errs = len(errors)
+    new_errors = [None] * (num_errs - 1)
+
+    l_hat, new_errors[0] = eft.add_eft_array(errors[0], errors[1])
+    for j in range(2, num_errs):
+        l_hat, new_errors[j - 1] = eft.add_eft_array(l_hat, errors[j])
+
+    return new_errors, l_hat
+
+
+def _compensated_k_array(x, coeffs, K):
+    """Vectorized version of :func:`_compensated_k`.
+
+    Keeps the ``dtype`` of ``x`` (which should match ``coeffs``) and
+    performs exactly the operations done by :func:`_compensated_k`.
+    """
+    bk = [np.empty_like(x)] + [np.zeros_like(x) for _ in range(K - 1)]
+    if not coeffs:
+        bk[0][...] = 0.0
+        return tuple(bk)
+
+    bk[0][...] = coeffs[0]
+    for coeff in _tail(coeffs):
+        # Update the "level 0" stuff.
+        P, pi = eft.multiply_eft_array(bk[0], x)
+        S, sigma = eft.add_eft_array(P, coeff)
+        new_bk = [S]
+
+        errors = [pi, sigma]
+        for F in range(1, K - 2 + 1):
+            new_errors, l_hat = _error_sum_eft_array(errors)
+            P, pi = eft.multiply_eft_array(bk[F], x)
+            S, sigma = eft.add_eft_array(P, l_hat)
+            new_bk.append(S)
+
+            new_errors.extend([pi, sigma])
+            errors = new_errors
+
+        # Update the last level without error-free transformations.
+        l_hat = errors[0] + errors[1]
+        for error in errors[2:]:
+            l_hat = l_hat + error
+        new_bk.append(x * bk[K - 1] + l_hat)
+
+        # Update the "current" values.
+        bk = new_bk
+
+    return tuple(bk)
+
+
+def compensated_k_array(x, coeffs, k):
+    """Vectorized version of :func:`compensated_k`.
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+        k (int): The number of compensation levels.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``. Each value is identical to the one computed by
+        :func:`compensated_k`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if k == 1:
+        return _basic_array(x, coeffs)
+
+    to_sum = np.stack(_compensated_k_array(x, coeffs, k))
+    return eft.sum_k_array(to_sum, k)
+
+
+def basic_multi(x, coeffs):
+    """Perform Horner's method for many polynomials at once.
+
+    Args:
+        x (Union[float, numpy.ndarray]): The point to evaluate at. Either
+            a single point shared by all polynomials or a 1D array with
+            one point per polynomial.
+        coeffs (numpy.ndarray): A 2D array of coefficients, with one row
+            (ordered from :math:`a_n` to :math:`a_0`) per polynomial.
+
+    Returns:
+        numpy.ndarray: The 1D array of values, one per polynomial. Each
+        value is identical to the one computed by :func:`basic`.
+
+    Raises:
+        ValueError: If ``coeffs`` is not 2D.
+        ValueError: If ``x`` is not a single point or 1D with one point
+            per polynomial.
+    """
+    x, columns = eft._multi_args(x, coeffs)
+    return _basic_array(x, columns)
+
+
+def compensated_multi(x, coeffs):
+    """Perform compensated Horner's method for many polynomials at once.
+
+    Args:
+        x (Union[float, numpy.ndarray]): The point to evaluate at. Either
+            a single point shared by all polynomials or a 1D array with
+            one point per polynomial.
+        coeffs (numpy.ndarray): A 2D array of coefficients, with one row
+            (ordered from :math:`a_n` to :math:`a_0`) per polynomial.
+
+    Returns:
+        numpy.ndarray: The 1D array of values, one per polynomial. Each
+        value is identical to the one computed by :func:`compensated`.
+
+    Raises:
+        ValueError: If ``coeffs`` is not 2D.
+        ValueError: If ``x`` is not a single point or 1D with one point
+            per polynomial.
+    """
+    x, columns = eft._multi_args(x, coeffs)
+    p, e = _compensated_array(x, columns)
+    return p + e
 
 
 def basic_newton_update(x, coeffs):
@@ -131,7 +505,7 @@ def hd1(x, coeffs):
     y1 = 0.0
     y2 = coeffs[0]
 
-    for coeff in coeffs[1:-1]:
+    for coeff in _interior(coeffs):
         # Update ``y1``.
         y1 = x * y1 + y2
         # Update ``y2``.
@@ -141,22 +515,14 @@ def hd1(x, coeffs):
     return x * y1 + y2
 
 
-def compensated_hd1(x, coeffs):
-    """Performs the compensated ``HD`` algorithm when ``k = 1``.
-
-    .. _JGH+13: https://dx.doi.org/10.1016/j.cam.2012.11.008
-
-    See the `JGH+13`_ paper for more details on the ``HD`` algorithm and the
-    ``CompHD`` algorithm.
-
-    Here ``HD`` stands for "Horner derivative".
-    """
+def _compensated_hd1(x, coeffs):
+    # Helper for ``compensated_hd1``; returns ``y1`` and its error ``e1``.
     y1 = 0.0
     y2 = coeffs[0]
     e1 = 0.0  # y1_hat = y1 + e1
     e2 = 0.0  # y2_hat = y2 + e2
 
-    for coeff in coeffs[1:-1]:
+    for coeff in _interior(coeffs):
         # Update ``y1`` and ``e1``.
         prod, pi = eft.multiply_eft(x, y1)
         y1, sigma = eft.add_eft(prod, y2)
@@ -171,16 +537,135 @@ def compensated_hd1(x, coeffs):
     y1, sigma = eft.add_eft(prod, y2)
     e1 = x * e1 + e2 + (pi + sigma)
 
+    return y1, e1
+
+
+def compensated_hd1(x, coeffs):
+    """Performs the compensated ``HD`` algorithm when ``k = 1``.
+
+    .. _JGH+13: https://dx.doi.org/10.1016/j.cam.2012.11.008
+
+    See the `JGH+13`_ paper for more details on the ``HD`` algorithm and the
+    ``CompHD`` algorithm.
+
+    Here ``HD`` stands for "Horner derivative".
+    """
+    y1, e1 = _compensated_hd1(x, coeffs)
     # Return the compensated form of ``y1``.
     return y1 + e1
 
 
+def _num_levels(coeffs, m):
+    # Helper for the Horner-Shaw-Traub functions.
+    if m is None:
+        return max(len(coeffs) - 1, 0)
+    if m < 0:
+        raise ValueError("Expected a non-negative number of derivatives", m)
+    return m
+
+
+def taylor(x, coeffs, m=None):
+    """Performs the Horner-Shaw-Traub algorithm.
+
+    Returns the ``m + 1`` Taylor coefficients ``p^{(k)}(x) / k!``; ``m``
+    defaults to the degree.
+    """
+    # See: Shaw and Traub, J. ACM 21 (1974).
+    m = _num_levels(coeffs, m)
+    y = [0.0] * (m + 1)
+    if not coeffs:
+        return tuple(y)
+
+    y[0] = coeffs[0]
+    for coeff in _tail(coeffs):
+        # NOTE: The levels are updated from the top down so that each
+        #       uses the previous value of the level below it.
+        for k in range(m, 0, -1):
+            y[k] = x * y[k] + y[k - 1]
+        y[0] = x * y[0] + coeff
+
+    return tuple(y)
+
+
+def _compensated_taylor(x, coeffs, m):
+    # Helper for ``compensated_taylor``; returns the Taylor coefficients
+    # and their errors.
+    y = [0.0] * (m + 1)
+    e = [0.0] * (m + 1)  # y_hat[k] = y[k] + e[k]
+    if not coeffs:
+        return y, e
+
+    y[0] = coeffs[0]
+    for coeff in _tail(coeffs):
+        for k in range(m, 0, -1):
+            prod, pi = eft.multiply_eft(x, y[k])
+            y[k], sigma = eft.add_eft(prod, y[k - 1])
+            e[k] = x * e[k] + e[k - 1] + (pi + sigma)
+        prod, pi = eft.multiply_eft(x, y[0])
+        y[0], sigma = eft.add_eft(prod, coeff)
+        e[0] = x * e[0] + (pi + sigma)
+
+    return y, e
+
+
+def compensated_taylor(x, coeffs, m=None):
+    """Performs the compensated Horner-Shaw-Traub algorithm."""
+    m = _num_levels(coeffs, m)
+    y, e = _compensated_taylor(x, coeffs, m)
+    return tuple(y_k + e_k for y_k, e_k in zip(y, e))
+
+
+def compensated_derivatives(x, coeffs, m=None):
+    """Compute ``p(x), p'(x), ..., p^{(m)}(x)`` with compensation."""
+    taylor_coeffs = compensated_taylor(x, coeffs, m)
+    return tuple(
+        math.factorial(k) * value for k, value in enumerate(taylor_coeffs)
+    )
+
+
+def compensated_taylor_array(x, coeffs, m=None):
+    """Vectorized version of :func:`compensated_taylor`.
+
+    The result has shape ``(m + 1,) + x.shape``.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    m = _num_levels(coeffs, m)
+    y = np.zeros((m + 1,) + x.shape)
+    e = np.zeros_like(y)
+    if not coeffs:
+        return y
+
+    y[0] = coeffs[0]
+    for coeff in _tail(coeffs):
+        for k in range(m, 0, -1):
+            prod, pi = eft.multiply_eft_array(x, y[k])
+            y[k], sigma = eft.add_eft_array(prod, y[k - 1])
+            e[k] = x * e[k] + e[k - 1] + (pi + sigma)
+        prod, pi = eft.multiply_eft_array(x, y[0])
+        y[0], sigma = eft.add_eft_array(prod, coeff)
+        e[0] = x * e[0] + (pi + sigma)
+
+    return y + e
+
+
+def compensated_derivatives_array(x, coeffs, m=None):
+    """Vectorized version of :func:`compensated_derivatives`.
+
+    The result has shape ``(m + 1,) + x.shape``.
+    """
+    taylor_coeffs = compensated_taylor_array(x, coeffs, m)
+    for k in range(2, taylor_coeffs.shape[0]):
+        taylor_coeffs[k] *= math.factorial(k)
+    return taylor_coeffs
+
+
 def basic_newton(x0, coeffs, max_iter=100, tol=1e-15):
     """Perform Newton's method to find a root of a polynomial.
 
     This assumes ``coeffs`` are the coefficients of :math:`p(s)` in the
     monomial basis.
     """
+    coeffs = _as_polynomial(coeffs)
     curr_x = x0
     for _ in range(max_iter):
         next_x = basic_newton_update(curr_x, coeffs)
@@ -198,6 +683,7 @@ def accurate_newton_update(x, coeffs):
 
 
 def accurate_newton(x0, coeffs, max_iter=100, tol=1e-15):
+    coeffs = _as_polynomial(coeffs)
     curr_x = x0
     for _ in range(max_iter):
         next_x = accurate_newton_update(curr_x, coeffs)
@@ -215,6 +701,7 @@ def full_newton_update(x, coeffs):
 
 
 def full_newton(x0, coeffs, max_iter=100, tol=1e-15):
+    coeffs = _as_polynomial(coeffs)
     curr_x = x0
     for _ in range(max_iter):
         next_x = full_newton_update(curr_x, coeffs)
@@ -223,3 +710,167 @@ def full_newton(x0, coeffs, max_iter=100, tol=1e-15):
         curr_x = next_x
 
     return curr_x
+
+
+def compensated_newton_update(x, coeffs):
+    """Perform a Newton update that carries errors through the quotient."""
+    numerator, numerator_err = _compensated_error(x, coeffs)
+    denominator = compensated_hd1(x, coeffs)
+    quotient, remainder = eft.divide_eft(numerator, denominator)
+    correction = (remainder + numerator_err) / denominator
+    next_x, error = eft.add_eft(x, -quotient)
+    return next_x + (error - correction)
+
+
+def compensated_newton(x0, coeffs, max_iter=100, tol=1e-15):
+    coeffs = _as_polynomial(coeffs)
+    curr_x = x0
+    for _ in range(max_iter):
+        next_x = compensated_newton_update(curr_x, coeffs)
+        if abs(next_x - curr_x) < tol:
+            return next_x
+        curr_x = next_x
+
+    return curr_x
+
+
+def _complex_product(val1, val2):
+    # Helper for the complex compensated functions.
+    # NOTE: This uses the textbook formula (as CPython does) rather than
+    #       relying on NumPy, which may use an FMA for complex products.
+    real = val1.real * val2.real - val1.imag * val2.imag
+    imag = val1.real * val2.imag + val1.imag * val2.real
+    return real, imag
+
+
+def _compensated_complex(x, coeffs):
+    # Helper for ``compensated_complex``; returns ``p`` and its error ``e``.
+    if not coeffs:
+        return 0j, 0j
+
+    p = complex(coeffs[0])
+    e = 0j
+    for coeff in _tail(coeffs):
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex(p, x)
+        p, sigma = eft.add_eft_complex(prod, coeff)
+        e = complex(*_complex_product(x, e)) + (((pi1 + pi2) + pi3) + sigma)
+
+    return p, e
+
+
+def compensated_complex(x, coeffs):
+    """Perform compensated Horner's method in complex arithmetic."""
+    # See: Graillat and Menissier-Morain, Inf. Comput. 216 (2012).
+    p, e = _compensated_complex(x, coeffs)
+    return p + e
+
+
+def compensated_complex_array(x, coeffs):
+    """Vectorized version of :func:`compensated_complex`."""
+    x = np.asarray(x, dtype=np.complex128)
+    p = np.zeros_like(x)
+    e = np.zeros_like(x)
+    if not coeffs:
+        return p
+
+    p[...] = coeffs[0]
+    for coeff in _tail(coeffs):
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex_array(p, x)
+        p, sigma = eft.add_eft_complex_array(prod, coeff)
+        e = eft._as_complex_array(*_complex_product(x, e)) + (
+            ((pi1 + pi2) + pi3) + sigma
+        )
+
+    return p + e
+
+
+def _compensated_hd1_complex(x, coeffs):
+    # Helper for ``compensated_hd1_complex``; returns ``y1`` and its
+    # error ``e1``.
+    y1 = 0j
+    y2 = complex(coeffs[0])
+    e1 = 0j  # y1_hat = y1 + e1
+    e2 = 0j  # y2_hat = y2 + e2
+
+    for coeff in _interior(coeffs):
+        # Update ``y1`` and ``e1``.
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex(x, y1)
+        y1, sigma = eft.add_eft_complex(prod, y2)
+        e1 = (
+            complex(*_complex_product(x, e1))
+            + e2
+            + (((pi1 + pi2) + pi3) + sigma)
+        )
+        # Update ``y2`` and ``e2``.
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex(x, y2)
+        y2, sigma = eft.add_eft_complex(prod, coeff)
+        e2 = complex(*_complex_product(x, e2)) + (((pi1 + pi2) + pi3) + sigma)
+
+    # Perform one last update of ``y1`` and ``e1``.
+    prod, pi1, pi2, pi3 = eft.multiply_eft_complex(x, y1)
+    y1, sigma = eft.add_eft_complex(prod, y2)
+    e1 = complex(*_complex_product(x, e1)) + e2 + (((pi1 + pi2) + pi3) + sigma)
+
+    return y1, e1
+
+
+def compensated_hd1_complex(x, coeffs):
+    """Performs the compensated ``HD`` algorithm in complex arithmetic."""
+    y1, e1 = _compensated_hd1_complex(x, coeffs)
+    return y1 + e1
+
+
+def compensated_hd1_complex_array(x, coeffs):
+    """Vectorized version of :func:`compensated_hd1_complex`."""
+    x = np.asarray(x, dtype=np.complex128)
+    y1 = np.zeros_like(x)
+    y2 = np.empty_like(x)
+    y2[...] = coeffs[0]
+    e1 = np.zeros_like(x)
+    e2 = np.zeros_like(x)
+
+    for coeff in _interior(coeffs):
+        # Update ``y1`` and ``e1``.
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex_array(x, y1)
+        y1, sigma = eft.add_eft_complex_array(prod, y2)
+        e1 = (
+            eft._as_complex_array(*_complex_product(x, e1))
+            + e2
+            + (((pi1 + pi2) + pi3) + sigma)
+        )
+        # Update ``y2`` and ``e2``.
+        prod, pi1, pi2, pi3 = eft.multiply_eft_complex_array(x, y2)
+        y2, sigma = eft.add_eft_complex_array(prod, coeff)
+        e2 = eft._as_complex_array(*_complex_product(x, e2)) + (
+            ((pi1 + pi2) + pi3) + sigma
+        )
+
+    # Perform one last update of ``y1`` and ``e1``.
+    prod, pi1, pi2, pi3 = eft.multiply_eft_complex_array(x, y1)
+    y1, sigma = eft.add_eft_complex_array(prod, y2)
+    e1 = (
+        eft._as_complex_array(*_complex_product(x, e1))
+        + e2
+        + (((pi1 + pi2) + pi3) + sigma)
+    )
+
+    return y1 + e1
+
+
+def full_newton_complex_update(x, coeffs):
+    numerator = compensated_complex(x, coeffs)
+    denominator = compensated_hd1_complex(x, coeffs)
+    return x - numerator / denominator
+
+
+def full_newton_complex(x0, coeffs, max_iter=100, tol=1e-15):
+    """Perform Newton's method to polish a complex root of a polynomial."""
+    coeffs = _as_polynomial(coeffs)
+    curr_x = complex(x0)
+    for _ in range(max_iter):
+        next_x = full_newton_complex_update(curr_x, coeffs)
+        if abs(next_x - curr_x) < tol:
+            return next_x
+        curr_x = next_x
+
+    return curr_x
@@ -0,0 +1,333 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""Multipoint evaluation via a subproduct tree.
+
+For points :math:`x_1, \ldots, x_m`, the subproduct tree holds the
+products :math:`M(x) = \prod (x - x_k)` over halves, quarters, etc. of the
+points. Since :math:`p(x_k) = (p \bmod M)(x_k)` whenever :math:`M(x_k) =
+0`, the remainder of :math:`p` is pushed down the tree (each remainder
+has degree less than the number of points below it) until only a small
+polynomial is left for each leaf, which is then evaluated with Horner's
+method. With FFT-based products and divisions this uses
+:math:`O(M(m) \log m)` operations rather than the :math:`O(n m)` used by
+Horner's method.
+
+.. warning::
+
+   In floating point, this is **much** less stable than Horner's method.
+   The coefficients of :math:`M` grow like :math:`\prod (1 + |x_k|)` and
+   the remainders lose (roughly) that many bits to cancellation (see
+   :func:`growth_bits`), so for points in :math:`[-1, 1]` all accuracy
+   is lost after a few dozen points per tree and the computation
+   overflows for a few thousand. It is only accurate when the points are
+   small (e.g. a few thousand points in :math:`[-0.01, 0.01]`).
+
+   The tree is also slower than batched Horner's method unless the
+   problem is large: with NumPy on a single core it only wins once
+   ``degree * num_points`` is about :math:`2^{26}` (e.g. 16000 points
+   and degree 16000 take 0.09s rather than 0.26s, while 2000 points and
+   degree 2000 take 0.014s rather than 0.006s). :func:`evaluate` uses
+   the tree automatically only when it is both faster and safe (see
+   :func:`use_tree`) and refuses to use it when all bits would be lost.
+
+   The compensated option replaces each long division with one built on
+   error-free transformations; this recovers the bits lost in the
+   divisions themselves, but not the rounding of the products in the
+   tree, and it uses classical (quadratic) long division, so it is never
+   faster than compensated Horner's method.
+
+.. note::
+
+   To match :mod:`horner`, this assumes throughout that ``coeffs`` is
+   ordered from :math:`a_n` to :math:`a_0`. The same (highest degree
+   first) order is used for every polynomial in the tree.
+"""
+
+import numpy as np
+
+import eft
+import horner
+
+# NOTE: Below this length, (batched) products are computed directly;
+#       above it, via the FFT.
+_FFT_THRESHOLD = 64
+DEFAULT_LEAF_SIZE = 32
+# NOTE: The tree is only chosen automatically when ``degree * num_points``
+#       is at least this large (and the degree is at least the number of
+#       points). This was measured with NumPy on a single core: the tree
+#       only wins once FFT products dominate.
+MIN_TREE_WORK = 2 ** 26
+# NOTE: The tree is only chosen automatically when the estimated
+#       coefficient growth (in bits) is at most this large, i.e. about
+#       half of the 53 bits in a ``float`` may be lost.
+MAX_GROWTH_BITS = 26.0
+# NOTE: Beyond this growth (the precision of a ``float``), no bits of the
+#       result can be trusted, so the tree is never used.
+_PRECISION_BITS = 53.0
+
+
+def _multiply(poly1, poly2):
+    # Product of two batches of polynomials (along the last axis).
+    size1 = poly1.shape[-1]
+    size2 = poly2.shape[-1]
+    if min(size1, size2) <= _FFT_THRESHOLD:
+        shape = np.broadcast(poly1[..., 0], poly2[..., 0]).shape
+        result = np.zeros(shape + (size1 + size2 - 1,))
+        for j in range(size1):
+            result[..., j : j + size2] += poly1[..., j : j + 1] * poly2
+        return result
+
+    size = size1 + size2 - 1
+    fft_size = 1 << (size - 1).bit_length()
+    result = np.fft.irfft(
+        np.fft.rfft(poly1, fft_size) * np.fft.rfft(poly2, fft_size), fft_size
+    )
+    return result[..., :size]
+
+
+def subproduct_tree(points):
+    """Build the subproduct tree for blocks of points.
+
+    Args:
+        points (numpy.ndarray): A 2D array of points, one leaf per row.
+            The number of rows must be a power of two.
+
+    Returns:
+        List[numpy.ndarray]: The levels of the tree, from the root to the
+        leaves. Level ``L`` is a 2D array with one (monic, highest degree
+        first) product per row.
+
+    Raises:
+        ValueError: If ``points`` is not 2D or the number of rows is not
+            a power of two.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2:
+        raise ValueError("Expected a 2D array of points", points.shape)
+    num_leaves, leaf_size = points.shape
+    if num_leaves & (num_leaves - 1) != 0:
+        raise ValueError("Expected a power of two leaves", num_leaves)
+
+    # Multiply out the leaves one linear factor at a time.
+    level = np.zeros((num_leaves, leaf_size + 1))
+    level[:, 0] = 1.0
+    for j in range(leaf_size):
+        level[:, 1 : j + 2] -= points[:, j : j + 1] * level[:, : j + 1]
+
+    levels = [level]
+    while level.shape[0] > 1:
+        level = _multiply(level[0::2], level[1::2])
+        # NOTE: The FFT need not reproduce the leading 1 exactly.
+        level[:, 0] = 1.0
+        levels.append(level)
+
+    levels.reverse()
+    return levels
+
+
+def _inverse_series(divisors, length):
+    # Helper for ``_remainder``. If ``f`` is the reversal of a (monic)
+    # divisor, this computes ``1 / f`` modulo ``x^length`` via Newton's
+    # method ``g <- g (2 - f g)``.
+    # NOTE: Since ``divisors`` are stored highest degree first, they are
+    #       already the coefficients of ``f`` lowest degree first.
+    inverse = np.ones(divisors.shape[:-1] + (1,))
+    size = 1
+    while size < length:
+        size = min(2 * size, length)
+        correction = -_multiply(divisors[..., :size], inverse)[..., :size]
+        correction[..., 0] += 2.0
+        inverse = _multiply(inverse, correction)[..., :size]
+
+    return inverse
+
+
+def _pad(dividends, size):
+    # Helper for ``_remainder`` and ``_remainder_compensated``.
+    num_coeffs = dividends.shape[-1]
+    if num_coeffs >= size:
+        return dividends
+    padding = np.zeros(dividends.shape[:-1] + (size - num_coeffs,))
+    return np.concatenate([padding, dividends], axis=-1)
+
+
+def _remainder(dividends, divisors):
+    # Remainder of a batch of dividends by a batch of monic divisors.
+    # The quotient comes from the reversed dividends times the inverse of
+    # the reversed divisors.
+    degree = divisors.shape[-1] - 1
+    dividends = _pad(dividends, degree)
+    num_quotient = dividends.shape[-1] - degree
+    if num_quotient <= 0:
+        return dividends
+
+    inverse = _inverse_series(divisors, num_quotient)
+    quotient = _multiply(dividends[..., :num_quotient], inverse)
+    quotient = quotient[..., :num_quotient]
+    remainder = dividends - _multiply(quotient, divisors)
+    return remainder[..., num_quotient:]
+
+
+def _remainder_compensated(high, low, divisors):
+    # Compensated version of ``_remainder``. The dividend is ``high +
+    # low``; classical long division is done on ``high`` with error-free
+    # transformations and the errors (along with ``low``) are divided
+    # without them.
+    degree = divisors.shape[-1] - 1
+    high = _pad(high, degree).copy()
+    low = _pad(low, degree).copy()
+    num_quotient = high.shape[-1] - degree
+    if num_quotient <= 0:
+        return high, low
+
+    for k in range(num_quotient):
+        quotient = high[..., k : k + 1]
+        prod, pi = eft.multiply_eft_array(quotient, divisors[..., 1:])
+        high[..., k + 1 : k + degree + 1], sigma = eft.add_eft_array(
+            high[..., k + 1 : k + degree + 1], -prod
+        )
+        low[..., k + 1 : k + degree + 1] += sigma - pi
+
+    # The leading coefficients of ``low`` are divided without error-free
+    # transformations.
+    for k in range(num_quotient):
+        quotient = low[..., k : k + 1]
+        low[..., k + 1 : k + degree + 1] -= quotient * divisors[..., 1:]
+
+    return high[..., num_quotient:], low[..., num_quotient:]
+
+
+def growth_bits(x):
+    r"""Estimate the bits lost to coefficient growth in the tree.
+
+    This is :math:`\sum_k \log_2 \left(1 + |x_k|\right)`, i.e. the
+    logarithm of a bound on the coefficients of :math:`\prod (x - x_k)`.
+
+    Args:
+        x (numpy.ndarray): The points.
+
+    Returns:
+        float: The estimated number of bits.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    return float(np.sum(np.log2(1.0 + np.abs(x))))
+
+
+def use_tree(x, coeffs):
+    """Decide if :func:`evaluate` should use the subproduct tree.
+
+    Args:
+        x (numpy.ndarray): The points.
+        coeffs (Sequence[float]): The coefficients.
+
+    Returns:
+        bool: Indicates if the problem is large enough for the tree to be
+        faster than batched Horner's method **and** the estimated
+        coefficient growth (see :func:`growth_bits`) is at most
+        :data:`MAX_GROWTH_BITS`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    degree = len(coeffs) - 1
+    if degree < x.size or degree * x.size < MIN_TREE_WORK:
+        return False
+    return growth_bits(x) <= MAX_GROWTH_BITS
+
+
+def _tree_evaluate(x, coeffs, leaf_size, compensated):
+    # Helper for ``evaluate``; ``x`` is 1D.
+    num_points = x.size
+    num_leaves = -(-num_points // leaf_size)
+    num_leaves = 1 << (num_leaves - 1).bit_length()
+    # Pad with zeros: a factor of ``x^k`` is exact (and adds nothing to
+    # the coefficient growth) while a repeated non-zero root is not.
+    padding = np.zeros(num_leaves * leaf_size - num_points)
+    points = np.concatenate([x, padding]).reshape(num_leaves, leaf_size)
+    levels = subproduct_tree(points)
+
+    high = np.asarray(coeffs, dtype=np.float64)[np.newaxis, :]
+    low = np.zeros_like(high)
+    for depth, divisors in enumerate(levels):
+        if depth > 0:
+            # Each child starts from the remainder of its parent.
+            high = np.repeat(high, 2, axis=0)
+            low = np.repeat(low, 2, axis=0)
+        if compensated:
+            high, low = _remainder_compensated(high, low, divisors)
+        else:
+            high = _remainder(high, divisors)
+
+    # Evaluate each leaf remainder at the points of that leaf.
+    high_columns = tuple(high.T[:, :, np.newaxis])
+    if compensated:
+        low_columns = tuple(low.T[:, :, np.newaxis])
+        p, e = horner._compensated_array(points, high_columns)
+        values = p + (e + horner._basic_array(points, low_columns))
+    else:
+        values = horner._basic_array(points, high_columns)
+
+    return values.ravel()[:num_points]
+
+
+def evaluate(x, coeffs, compensated=False, method="auto", leaf_size=None):
+    """Evaluate a polynomial at many points.
+
+    Args:
+        x (numpy.ndarray): The points to evaluate at.
+        coeffs (Sequence[float]): The coefficients.
+        compensated (Optional[bool]): Indicates if the compensated
+            algorithms should be used (:func:`horner.compensated_array`
+            or compensated long division in the tree). Defaults to
+            :data:`False`.
+        method (Optional[str]): One of ``"auto"`` (use
+            :func:`use_tree` to decide), ``"horner"`` or ``"tree"``.
+            Defaults to ``"auto"``. Since the compensated tree uses
+            classical long division, ``"auto"`` always uses Horner's
+            method when ``compensated=True``.
+        leaf_size (Optional[int]): The number of points in each leaf of
+            the tree. Defaults to :data:`DEFAULT_LEAF_SIZE`.
+
+    Returns:
+        numpy.ndarray: The values of the polynomial, with the same shape
+        as ``x``.
+
+    Raises:
+        ValueError: If ``method`` is not one of the allowed values.
+        ValueError: If ``method="tree"`` and the estimated coefficient
+            growth exceeds the precision of a ``float`` (so the result
+            would be meaningless).
+    """
+    if method not in ("auto", "horner", "tree"):
+        raise ValueError("Unexpected method", method)
+
+    x = np.asarray(x, dtype=np.float64)
+    if method == "auto":
+        if not compensated and use_tree(x, coeffs):
+            method = "tree"
+        else:
+            method = "horner"
+
+    if method == "horner" or x.size == 0 or not coeffs:
+        if compensated:
+            return horner.compensated_array(x, coeffs)
+        return horner.basic_array(x, coeffs)
+
+    bits = growth_bits(x)
+    if bits > _PRECISION_BITS:
+        raise ValueError(
+            "Coefficient growth in the subproduct tree is too large", bits
+        )
+
+    if leaf_size is None:
+        leaf_size = DEFAULT_LEAF_SIZE
+    values = _tree_evaluate(x.ravel(), coeffs, leaf_size, compensated)
+    return values.reshape(x.shape)
@@ -40,7 +40,21 @@ def compensated_residual(s, coeffs1, t, coeffs2):
     return np.array([[dx], [dy]])
 
 
-def newton(s0, coeffs1, t0, coeffs2, residual):
+def compensated_solve(J, F):
+    """Solve a 2x2 system with Cramer's rule and compensated dot products.
+
+    Each determinant is computed with :func:`eft.dot2`, i.e. as if in
+    twice the working precision, before the (rounded) divisions.
+    """
+    (a, b), (c, d) = J
+    f1, f2 = F.flatten()
+    det = eft.dot2((a, -b), (d, c))
+    ds = eft.dot2((d, -b), (f1, f2)) / det
+    dt = eft.dot2((a, -c), (f2, f1)) / det
+    return np.array([[ds], [dt]])
+
+
+def newton(s0, coeffs1, t0, coeffs2, residual, solve=np.linalg.solve):
     max_iter = 50
     tol = 1e-15
     s = s0
@@ -56,7 +70,7 @@ def newton(s0, coeffs1, t0, coeffs2, residual):
         dy2 = de_casteljau.derivative(t, coeffs2[1, :])
         J = np.array([[dx1, -dx2], [dy1, -dy2]])
         # Solve for the updates.
-        ds, dt = np.linalg.solve(J, F).flatten()
+        ds, dt = solve(J, F).flatten()
         # Apply the updates.
         s = s - ds
         t = t - dt